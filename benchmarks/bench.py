@@ -0,0 +1,262 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+"""
+Benchmark suite for MindMaze.
+
+Run from the repository root:
+
+    python -m benchmarks.bench                       # run everything and print JSON
+    python -m benchmarks.bench --save-baseline       # store the results as the baseline
+    python -m benchmarks.bench --compare             # run and compare against the stored baseline
+
+Everything runs headless on SDL's dummy video driver. Results are reported as JSON with the median, p90 and p99 of
+every measurement, and --compare exits with status 1 if any median got slower than the baseline by more than the
+allowed tolerance.
+"""
+
+# Run without a window, with the repository root on the path for the mindmaze package.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(REPO_ROOT)
+sys.path.insert(0, REPO_ROOT)
+
+from mindmaze.maze import GENERATORS, Maze, view_codes  # noqa: E402
+from mindmaze.question_bank import Question, QuestionScheduler  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+DEFAULT_SIZES = [15, 50, 100, 250, 500, 1000]
+
+
+# Helper function - summarizes a list of samples in seconds
+def summarize(samples):
+    ordered = sorted(samples)
+
+    # Nearest-rank percentile
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+    return {
+        "count": len(ordered),
+        "median": statistics.median(ordered),
+        "p90": percentile(90),
+        "p99": percentile(99),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+# Helper function - fewer repeats for bigger mazes so the suite finishes in reasonable time
+def repeatsFor(size, repeats):
+    return max(1, repeats * 15 // max(15, size))
+
+
+# Function to time maze generation and measure its peak memory
+def benchGeneration(sizes, algorithms, repeats):
+    results = {}
+    for algorithm in algorithms:
+        for size in sizes:
+            samples = []
+            for i in range(repeatsFor(size, repeats)):
+                start = time.perf_counter()
+                Maze(size, seed=i, algorithm=algorithm).generate()
+                samples.append(time.perf_counter() - start)
+
+            # Peak memory is measured in a separate run, since tracing allocations slows generation down.
+            tracemalloc.start()
+            Maze(size, seed=0, algorithm=algorithm).generate()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            result = summarize(samples)
+            result["peak_bytes"] = peak
+            results[f"generate/{algorithm}/{size}"] = result
+    return results
+
+
+# Helper function - creates a Game on a seeded maze without opening a real window
+def makeGame(seed):
+    from mindmaze import game as mindMaze
+
+    game = mindMaze.Game()
+    # Stop the background maze and question workers so they don't compete with the loops being timed
+    game.shutdown()
+    grid, end = Maze(game.mazeSize, seed=seed).generate()
+    game.maze, game.mazeEnd = grid, end
+    game.viewCodes = view_codes(grid)
+    return mindMaze, game
+
+
+# Function to measure how many view keys can be computed per second
+def benchViewKeys(seed, iterations):
+    mindMaze, game = makeGame(seed)
+    rng = random.Random(seed)
+    openCells = [(int(a), int(b)) for a, b in zip(*(game.maze == 0).nonzero())]
+    directions = [[1, 0], [-1, 0], [0, 1], [0, -1]]
+    samples = []
+    for _ in range(iterations):
+        a, b = rng.choice(openCells)
+        game.arrow_rect.x = a * mindMaze.BLOCK_WIDTH
+        game.arrow_rect.y = b * mindMaze.BLOCK_HEIGHT
+        game.dir = rng.choice(directions)
+        start = time.perf_counter()
+        game.updateView()
+        samples.append(time.perf_counter() - start)
+    result = summarize(samples)
+    result["keys_per_second"] = len(samples) / sum(samples)
+    return {"view_keys": result}
+
+
+# Helper function - returns a scripted walk: move forward when possible, otherwise turn
+def scriptedWalk(game, rng, steps):
+    for _ in range(steps):
+        before = (game.arrow_rect.x, game.arrow_rect.y)
+        game.moveForward(game.dir)
+        if (game.arrow_rect.x, game.arrow_rect.y) == before or rng.random() < 0.2:
+            rng.choice((game.turnLeft, game.turnRight))()
+        yield
+
+
+# Function to measure the cost of rendering a frame during a scripted walk
+def benchRender(seed, frames, raycast=False):
+    mindMaze, game = makeGame(seed)
+    game.raycast = raycast
+    rng = random.Random(seed)
+    samples = []
+    for _ in scriptedWalk(game, rng, frames):
+        start = time.perf_counter()
+        game.play_step()
+        mindMaze.pygame.display.flip()
+        samples.append(time.perf_counter() - start)
+    result = summarize(samples)
+    result["frames_per_second"] = len(samples) / sum(samples)
+    return {"render/raycast" if raycast else "render/frame": result}
+
+
+# Function to measure drawing and answering questions with the adaptive scheduler on a big bank
+def benchQuestions(seed, size, draws):
+    tiers = [[Question(tier, i, f"q. {tier}-{i}", "right", ("a", "b", "c")) for i in range(size)] for tier in range(3)]
+    rng = random.Random(seed)
+    scheduler = QuestionScheduler(tiers, rng)
+    samples = []
+    for i in range(draws):
+        start = time.perf_counter()
+        question = scheduler.draw()
+        scheduler.answered(question, rng.random() < 0.7)
+        samples.append(time.perf_counter() - start)
+        # Move the focus along as a player would level up
+        scheduler.focus = 3 * i // draws
+    result = summarize(samples)
+    result["draws_per_second"] = len(samples) / sum(samples)
+    return {f"questions/draw_{size}": result}
+
+
+# Function to compare results against a baseline
+def compare(results, baseline, tolerance):
+    """Compares the median of every measurement against the baseline.
+
+    Args:
+        results (dict): Measurements from this run
+        baseline (dict): Measurements from the stored baseline
+        tolerance (float): Allowed slowdown, e.g. 0.1 for 10%
+
+    Returns:
+        list: Dicts describing every measurement that regressed
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = result["median"] / reference["median"] if reference["median"] else 1.0
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline_median": reference["median"],
+                    "median": result["median"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+# Function to run the suite from the command line
+def run(argv=None):
+    parser = argparse.ArgumentParser(description="MindMaze benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="maze sizes to generate")
+    parser.add_argument(
+        "--algorithms", nargs="+", default=["dfs"], choices=sorted(GENERATORS), help="generators to benchmark"
+    )
+    parser.add_argument("--repeats", type=int, default=15, help="generation repeats at size 15 (scaled down for bigger mazes)")
+    parser.add_argument("--view-iterations", type=int, default=20000, help="view keys to compute")
+    parser.add_argument("--frames", type=int, default=600, help="frames to render in the scripted walk")
+    parser.add_argument("--bank-size", type=int, default=100000, help="questions per tier in the scheduler benchmark")
+    parser.add_argument("--draws", type=int, default=20000, help="questions to draw and answer")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the mazes and the scripted walk")
+    parser.add_argument(
+        "--only", nargs="+", choices=["generate", "view", "render", "raycast", "questions"], help="run only these groups"
+    )
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file to save to or compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown before a median counts as a regression")
+    args = parser.parse_args(argv)
+    # Check for the baseline before spending minutes on benchmarks that can't be compared
+    if args.compare and not os.path.exists(args.baseline):
+        parser.error(f"no baseline at {args.baseline}; run --save-baseline first")
+
+    groups = set(args.only or ["generate", "view", "render", "raycast", "questions"])
+    results = {}
+    if "generate" in groups:
+        results.update(benchGeneration(args.sizes, args.algorithms, args.repeats))
+    if "view" in groups:
+        results.update(benchViewKeys(args.seed, args.view_iterations))
+    if "render" in groups:
+        results.update(benchRender(args.seed, args.frames))
+    if "raycast" in groups:
+        results.update(benchRender(args.seed, args.frames, raycast=True))
+    if "questions" in groups:
+        results.update(benchQuestions(args.seed, args.bank_size, args.draws))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    status = 0
+    if args.compare:
+        with open(args.baseline, "r") as baselineFile:
+            baseline = json.load(baselineFile)["results"]
+        report["regressions"] = compare(results, baseline, args.tolerance)
+        status = 1 if report["regressions"] else 0
+    if args.save_baseline:
+        with open(args.baseline, "w") as baselineFile:
+            json.dump(report, baselineFile, indent=2)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as outputFile:
+            outputFile.write(text + "\n")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(run())
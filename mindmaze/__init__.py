@@ -0,0 +1,19 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+"""
+Mind Maze.
+
+Start the game with python -m mindmaze (or python main.py from the repository root). Importing the package and its
+modules has no side effects - pygame is started and the font, sprite sheets and question bank are loaded by the first
+Game, so tools and benchmarks can import what they need without paying for the rest:
+
+    mindmaze.maze           maze generation, with numpy as its only dependency
+    mindmaze.maze_cache     memory-mapped cache of generated mazes
+    mindmaze.question_bank  question files, the compiled index and the adaptive scheduler (no pygame)
+    mindmaze.raycaster      first-person raycaster
+    mindmaze.profiler       frame phase profiler
+    mindmaze.game           the game itself
+"""
@@ -0,0 +1,12 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import sys
+
+from .game import main
+
+# Entry point for python -m mindmaze
+sys.exit(main())
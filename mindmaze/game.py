@@ -0,0 +1,1613 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import argparse
+import hashlib
+import json
+import numpy as np
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# pygame greets on stdout when it is imported unless this is set, and headless runs print their JSON report there
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame  # noqa: E402
+
+from .lazy import Lazy
+from .maze import HEADINGS, ChunkedMaze, Maze, distance_field, view_codes
+from .maze_cache import MazeCache
+from .profiler import FrameProfiler
+from .question_bank import QuestionBank, QuestionScheduler
+from .raycaster import PIXEL_MASKS, Raycaster
+
+"""
+DEV NOTES
+
+Need to fill out the question files that are not test files.
+    
+Can we also figure out some way to make the player rely on the actual game screen more?
+    I find myself pretty much exclusively using the minimap to navigate.
+    Perhaps just removing the red endpoint marker would do it, but right now that helps with testing since there are no
+    in-game door visuals yet.
+    - Lucas
+"""
+
+# CONSTANTS
+# Folder holding the fonts, sprite sheets and question files, and the caches built from them - the repository root
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Control map and minimap size
+MAZE_SIZE = 15
+# Largest minimap on screen - bigger mazes scroll a viewport centred on the player, or show a downsampled overview,
+# so the window size and the cost of drawing the minimap stay the same at any maze size
+MINIMAP_VIEWPORT = 310
+MINIMAP_SIZE = min((2 * MAZE_SIZE + 1) * 10, MINIMAP_VIEWPORT)
+# Set to True to start with the whole maze scaled down into the minimap instead of the viewport - M toggles it
+MINIMAP_OVERVIEW = False
+
+# Control window size
+WIDTH = max((400 + MINIMAP_SIZE), 610)
+HEIGHT = max(540, (MINIMAP_SIZE + 140))
+
+# Colors
+WHITE = (255, 255, 255)
+BLUE = (0, 0, 255)
+GREEN = (100, 180, 0)
+RED = (255, 0, 0)
+BLACK = (0, 0, 0)
+DARK_WHITE = (50, 50, 50)
+
+# Control Minimap display sizes
+BLOCK_WIDTH = 10
+BLOCK_HEIGHT = 10
+
+# Minimap arrow sprite for each heading in maze.HEADINGS
+ARROW_FRAMES = (2, 3, 0, 1)
+
+# Control defauls font - loaded the first time text is drawn
+FONT_FILE = os.path.join(ASSET_DIR, "DejavuSansMono-5m7L.ttf")
+FONT_SIZE = 15
+
+# Set to an int to make every level reproducible - level n is generated from MAZE_SEED + n.
+# Seeded levels are stored in MAZE_CACHE_DIR and served from there on later runs.
+MAZE_SEED = None
+MAZE_CACHE_DIR = os.path.join(ASSET_DIR, "maze_cache")
+MAZE_CACHE = MazeCache(MAZE_CACHE_DIR)
+# Generation algorithm for each level, repeating from the start once the list runs out - any name in maze.GENERATORS.
+MAZE_ALGORITHMS = ["dfs"]
+# Set to True for one endless maze that is generated in chunks around the player instead of a new maze every level.
+# Only a MAZE_SIZE window around the player is loaded; chunks far away are evicted and regenerated when revisited.
+ENDLESS_MODE = False
+ENDLESS_CHUNK_SIZE = 16
+ENDLESS_CACHE_CHUNKS = 64
+# How close (in grid cells) the player can get to the edge of the loaded window before it is re-centred
+ENDLESS_MARGIN = 6
+
+# Set to True to only redraw the parts of the screen that changed, and to sleep until input arrives instead of
+# redrawing every frame at a fixed 60 FPS
+DIRTY_RENDERING = True
+
+# Number of composited 3D views to keep - each one is a full view-sized surface, about 600 KB at 32 bits per pixel
+VIEW_CACHE_SIZE = 64
+# Set to True to composite the VIEW_CACHE_SIZE views nearest the start of a maze as soon as it is generated
+VIEW_CACHE_WARMUP = False
+
+# Set to True to draw the 3D view by raycasting the maze instead of from the wall sprites - R toggles it in dev mode.
+# The wall sprites only cover 4 cells ahead, the raycaster sees RAYCAST_DISTANCE cells.
+RAYCAST_RENDERING = False
+RAYCAST_DISTANCE = 16
+
+# Set to a path ending in .json or .csv to write a frame timing summary for every level there
+PROFILE_OUTPUT = None
+# Phases shown in the dev mode performance overlay (toggled with P), in display order
+PROFILER_PHASES = ["frame", "events", "view", "walls", "minimap", "text", "question", "flip"]
+# Seconds between refreshes of the overlay's numbers
+PROFILER_REFRESH = 0.5
+
+# Question files
+# QUESTION_FILES = ["Q_A_test.txt"] # This is for testing purposes only
+QUESTION_FILES = ["Q_A_easy.txt", "Q_A_medium.txt", "Q_A_hard.txt"]
+
+# Index of the question files - each file is compiled on its own and only checked again when its contents change
+QUESTION_BANK_INDEX = os.path.join(ASSET_DIR, ".question_cache", "index.json")
+
+# Pick questions by the player's level, wrong answers and how recently they were asked, instead of working through the
+# question files in order - a question answered wrong comes back after a few others, and one answered right is retired
+ADAPTIVE_QUESTIONS = True
+# Maze levels played on each question tier before the next, harder tier becomes the most likely one
+LEVELS_PER_TIER = 3
+# Cells from an exit at which the next question is picked in the background and its panel rendered, so opening it at
+# the exit only swaps in a finished surface
+QUESTION_PREFETCH_DISTANCE = 4
+
+# Global Non-Constants
+questionsRight = 0
+devMode = False
+
+
+# Class to cache rendered text so text that hasn't changed isn't rasterized again every frame
+class TextCache:
+    # Initialization function
+    def __init__(self, font, size=64, words=1024):
+        self.font = font
+        self.size = size
+        self.words = words
+        # (text, colour) -> surface, least recently used first
+        self.surfaces = OrderedDict()
+        # Measured widths of words, and (text, width) -> wrapped lines, least recently used first
+        self.wordWidths = OrderedDict()
+        self.layouts = OrderedDict()
+
+    # Function to get the surface for a string, rendering it only the first time
+    def render(self, text, colour):
+        key = (text, colour)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = self.font.render(text, False, colour)
+        self.surfaces[key] = surface
+        # Evict the text that was drawn longest ago
+        if len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    # Helper function - returns the width of a word, measuring it only the first time it is seen
+    def wordWidth(self, word):
+        width = self.wordWidths.get(word)
+        if width is not None:
+            self.wordWidths.move_to_end(word)
+            return width
+        width = self.wordWidths[word] = self.font.size(word)[0]
+        # Questions keep bringing new words, so forget the ones not wrapped for the longest time
+        if len(self.wordWidths) > self.words:
+            self.wordWidths.popitem(last=False)
+        return width
+
+    # Function to break text into lines that fit a width
+    def wrap(self, text, width):
+        """Breaks text greedily into as many lines as it needs to fit within width pixels.
+
+        Every word is measured once and line widths are summed from the word widths, so wrapping is linear in the
+        length of the text. Newlines in the text are kept, and a word wider than a whole line (long identifiers in
+        code snippets) is split between characters.
+
+        Args:
+            text (str): The text to wrap
+            width (int): Width available for each line, in pixels
+
+        Returns:
+            list: The lines of text
+        """
+        key = (text, width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            return lines
+
+        lines = []
+        spaceWidth = self.wordWidth(" ")
+        for paragraph in text.split("\n"):
+            line, lineWidth = [], 0
+            for word in paragraph.split(" "):
+                wordWidth = self.wordWidth(word)
+                # Split words that can never fit on a line of their own. The pieces are measured directly, since caching
+                # them would fill the word cache with fragments that are never seen again.
+                while wordWidth > width and len(word) > 1:
+                    cut = 1
+                    while cut < len(word) and self.font.size(word[: cut + 1])[0] <= width:
+                        cut += 1
+                    if line:
+                        lines.append(" ".join(line))
+                        line, lineWidth = [], 0
+                    lines.append(word[:cut])
+                    word = word[cut:]
+                    wordWidth = self.font.size(word)[0]
+                # Start a new line when the word doesn't fit on the current one
+                if line and lineWidth + spaceWidth + wordWidth > width:
+                    lines.append(" ".join(line))
+                    line, lineWidth = [], 0
+                lineWidth += (spaceWidth if line else 0) + wordWidth
+                line.append(word)
+            lines.append(" ".join(line))
+
+        self.layouts[key] = lines
+        if len(self.layouts) > self.size:
+            self.layouts.popitem(last=False)
+        return lines
+
+
+# Function to start pygame and name the window - done by the first Game rather than on import
+def initPygame():
+    if not pygame.get_init():
+        pygame.init()
+        pygame.display.set_caption("Mind Maze!")
+
+
+# Function to load the default font
+def loadFont():
+    initPygame()
+    return pygame.font.Font(FONT_FILE, FONT_SIZE)
+
+
+# Function to load every question, once, so drawing one during play never touches the disk
+def loadQuestionBank():
+    bank = QuestionBank.load([os.path.join(ASSET_DIR, name) for name in QUESTION_FILES], QUESTION_BANK_INDEX)
+    # Broken question files shift every question after the mistake, so say where it is
+    for problem in bank.problems:
+        if problem.severity == "error":
+            print(problem, file=sys.stderr)
+    return bank
+
+
+# Shared resources, loaded the first time they are used so importing this module stays cheap. main() loads the
+# question bank before the game starts so mistakes in the question files are reported up front, not mid-game.
+DEFAULT_FONT = Lazy(loadFont)
+QUESTION_BANK = Lazy(loadQuestionBank)
+QUESTION_SCHEDULER = Lazy(lambda: QuestionScheduler(QUESTION_BANK.tiers)) if ADAPTIVE_QUESTIONS else None
+
+# Shared cache for the HUD and other text drawn every frame
+TEXT_CACHE = TextCache(DEFAULT_FONT)
+
+# Shared profiler for the phases of every frame
+PROFILER = FrameProfiler()
+
+# Folder for pre-processed assets, rebuilt automatically when a source image changes
+ASSET_CACHE_DIR = os.path.join(ASSET_DIR, ".asset_cache")
+
+
+# Class to handle sprite sheets - Minimap Player Icon and Maze Walls
+class SpriteSheet(object):
+    # Initialization function
+    def __init__(self, file_name):
+        # Attemt to load the sprite sheet from the file name. If we can't, exit and explain.
+        try:
+            self.sprite_sheet = pygame.image.load(file_name).convert()
+        except pygame.error:
+            sys.exit("Could not load Image!")
+
+    # Gets the image and blits to the screen
+    def get_image(self, x, y, width, height):
+        image = pygame.Surface([width, height]).convert()
+        image.blit(self.sprite_sheet, (0, 0), (x, y, width, height))
+        image.set_colorkey(BLACK)
+        return image
+
+    # helper func - makes an array from sprite sheet
+    def make_sprite_array(self, x, y, width, height, numImages, imgPerRow, scale=1):
+        spriteList = []
+        imgInRowCount = 0
+        for i in range(numImages):
+            imgInRowCount += 1
+            image = self.get_image(x, y, width, height)
+            image = pygame.transform.scale(image, (width * scale, height * scale))
+            spriteList.append(image)
+
+            # grab images in row
+            if imgInRowCount < imgPerRow:
+                x += width
+            # move down a column and start at beginning of row
+            if imgInRowCount >= imgPerRow:
+                y += height
+                x = 0
+                imgInRowCount = 0
+
+        return spriteList
+
+    # helper func - makes an array of cropped, RLE-accelerated layers from sprite sheet
+    def make_layer_array(self, x, y, width, height, numImages, imgPerRow, scale=1):
+        """Slices and scales the sheet like make_sprite_array, then crops every image to its visible pixels.
+
+        Returns:
+            tuple: The list of cropped images and the list of (x, y) offsets to blit each one at
+        """
+        layers = []
+        offsets = []
+        for image in self.make_sprite_array(x, y, width, height, numImages, imgPerRow, scale):
+            # Smallest rect holding every pixel that isn't the colorkey - empty layers crop to nothing
+            bounds = image.get_bounding_rect()
+            layer = image.subsurface(bounds).copy()
+            layer.set_colorkey(BLACK, pygame.RLEACCEL)
+            layers.append(layer)
+            offsets.append(bounds.topleft)
+        return layers, offsets
+
+
+# Function to load the 3D view layers, using the processed copy on disk when it is still up to date
+def loadWallLayers(fileName, size, numImages, scale):
+    """Loads the wall layers of a sprite sheet scaled, cropped and RLE-accelerated.
+
+    The processed layers are packed into an atlas image in ASSET_CACHE_DIR next to a manifest of their positions
+    and offsets. Later startups load the atlas instead of scaling the sheet again, as long as the source image's
+    hash still matches.
+
+    Args:
+        fileName (str): Sprite sheet to load
+        size (int): Width and height of each image on the sheet
+        numImages (int): Number of images on the sheet, all in one row
+        scale (int): Scale factor to apply
+
+    Returns:
+        tuple: The list of layers and the list of (x, y) offsets to blit each one at
+    """
+    with open(fileName, "rb") as sheetFile:
+        digest = hashlib.sha1(sheetFile.read()).hexdigest()
+    key = [digest, size, numImages, scale]
+    base = os.path.join(ASSET_CACHE_DIR, f"{os.path.splitext(os.path.basename(fileName))[0]}@{scale}x")
+
+    # Use the cached atlas if it was built from this exact sheet
+    try:
+        with open(base + ".json", "r") as manifestFile:
+            manifest = json.load(manifestFile)
+        if manifest["key"] == key:
+            atlas = pygame.image.load(base + ".png").convert()
+            layers = []
+            offsets = []
+            for rect, offset in manifest["layers"]:
+                layer = atlas.subsurface(rect).copy()
+                layer.set_colorkey(BLACK, pygame.RLEACCEL)
+                layers.append(layer)
+                offsets.append(tuple(offset))
+            return layers, offsets
+    except (OSError, ValueError, KeyError, TypeError, pygame.error):
+        pass
+
+    layers, offsets = SpriteSheet(fileName).make_layer_array(
+        0, 0, size, size, numImages, numImages, scale
+    )
+
+    # Stack the layers top to bottom in one atlas and record where each one went
+    atlas = pygame.Surface(
+        (max(1, max(layer.get_width() for layer in layers)), max(1, sum(layer.get_height() for layer in layers)))
+    )
+    atlas.fill(BLACK)
+    rects = []
+    top = 0
+    for layer in layers:
+        atlas.blit(layer, (0, top))
+        rects.append([0, top, layer.get_width(), layer.get_height()])
+        top += layer.get_height()
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        pygame.image.save(atlas, base + ".png")
+        with open(base + ".json", "w") as manifestFile:
+            json.dump({"key": key, "layers": [list(pair) for pair in zip(rects, offsets)]}, manifestFile)
+    except (OSError, pygame.error):
+        # Without a writable cache we just process the sheet again next time
+        pass
+    return layers, offsets
+
+
+# Helper function - generates a maze and its view codes in one go
+def buildMaze(size, seed=None, algorithm="dfs"):
+    # Seeded mazes are deterministic, so they can be served from the on-disk cache.
+    if seed is None:
+        grid, end = Maze(size, algorithm=algorithm).generate()
+    else:
+        grid, end = MAZE_CACHE.get(
+            size,
+            seed,
+            algorithm,
+            lambda: Maze(size, seed, algorithm=algorithm).generate(),
+        )
+    return grid, end, view_codes(grid)
+
+
+# Class to build the next level's maze on a worker thread while the current level is being played
+class MazeProducer:
+    # Initialization function
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MazeProducer")
+        self.pending = None
+        self.pendingKey = None
+
+    # Starts building a maze of the given size, seed and algorithm in the background
+    def request(self, size, seed=None, algorithm="dfs"):
+        self.pending = self.executor.submit(buildMaze, size, seed, algorithm)
+        self.pendingKey = (size, seed, algorithm)
+
+    # Function to hand over the next maze
+    def take(self, size, seed=None, algorithm="dfs"):
+        """Returns the pre-generated maze, waiting for it if it is still being built, or generates one synchronously
+        if the worker was building a different maze.
+
+        Args:
+            size (int): Size of the maze that is needed
+            seed (int): Seed of the maze that is needed, or None for a random maze
+            algorithm (str): Name of the generation algorithm
+
+        Returns:
+            tuple: The (grid, end, viewCodes) of the maze
+        """
+        pending = self.pending
+        result = None
+        if pending is not None and self.pendingKey == (size, seed, algorithm):
+            # A running job can't be cancelled, so building the same maze again could only finish later than it.
+            if pending.exception() is None:
+                result = pending.result()
+        elif pending is not None:
+            # Built for another level - drop it if the worker hasn't started on it yet.
+            pending.cancel()
+        if result is None:
+            result = buildMaze(size, seed, algorithm)
+        self.pending = None
+        self.pendingKey = None
+        return result
+
+    # Function to stop the worker - a queued maze is dropped, and one being built is left to finish unobserved
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending = None
+        self.pendingKey = None
+
+
+# Sprites shared by every Game - the minimap arrow for each heading, and the 3D view's wall layers and their offsets
+ARROW_SPRITES = Lazy(
+    lambda: SpriteSheet(os.path.join(ASSET_DIR, "arrow-sheet.png")).make_sprite_array(0, 0, 10, 10, 4, 4)
+)
+WALL_LAYERS = Lazy(lambda: loadWallLayers(os.path.join(ASSET_DIR, "walls-sheet.png"), 194, 19, 2))
+
+
+# Class to handle gameplay functions
+class Game(pygame.sprite.Sprite):
+    # Initialization function
+    def __init__(self):
+        # Set initial variables within the game
+        super().__init__()
+
+        initPygame()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.clock = pygame.time.Clock()
+
+        self.frame_itter = 0
+
+        # Get the sprites for the  player indicator for the minimap
+        self.arrow_sheet = ARROW_SPRITES.load()
+        self.arrow_img = self.arrow_sheet[1]
+        self.arrow_rect = self.arrow_img.get_rect()
+        self.arrow_rect.x = BLOCK_WIDTH * 1
+        self.arrow_rect.y = BLOCK_HEIGHT * 1
+
+        # Get the sprites for the maze walls
+        # Each layer is cropped to its visible part and drawn at its offset within the view
+        self.walls_sheet, self.walls_offsets = WALL_LAYERS.load()
+        self.walls_img = self.walls_sheet[0]
+        self.walls_rect = pygame.Rect(0, 0, 194 * 2, 194 * 2)
+        self.walls_rect.x = max(210, MINIMAP_SIZE)
+        self.walls_rect.y = 0
+        # Composited 3D views by wall view bitmask, least recently used first
+        self.viewCache = OrderedDict()
+        # Raycast 3D view, rendered again only when the player moves or turns
+        self.raycast = RAYCAST_RENDERING
+        self.raycaster = Raycaster(self.walls_rect.width, self.walls_rect.height, RAYCAST_DISTANCE)
+        self.raySurface = pygame.Surface(self.walls_rect.size, 0, 32, PIXEL_MASKS)
+        self.rayMaze = None
+        self.rayKey = None
+
+        # UNUSED - MARK FOR DELETION?
+        self.toggleAltHallway = True
+
+        # Dev mode performance overlay, drawn over the top of the 3D view
+        self.showProfiler = False
+        self.profilerLines = ()
+        self.profilerSurfaces = []
+        self.profilerRefreshed = 0.0
+        self.profilerRect = pygame.Rect(
+            self.walls_rect.x, 0, self.walls_rect.width, 20 * (len(PROFILER_PHASES) + 1) + 10
+        )
+
+        # Variables relating to maze completion
+        self.currentQuestion = None
+        # The next question is picked on a worker thread as the player nears an exit - the future of the pick and its
+        # pre-rendered (rect, surface) panel
+        self.questionPrefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="QuestionPrefetch")
+        self.nextQuestion = None
+        self.nextPanel = None
+        self.lives = 3
+        self.mazeLevel = 1
+        # Nothing has been answered yet, so there's no need to load the question bank for its size
+        self.scorePercent = (questionsRight / QUESTION_BANK.total) * 100 if questionsRight else 0.0
+
+        # Variables relating to positioning and view
+        self.dir = [-1, 0]
+        self.wallView = 0b111011010000
+        self.mazeSize = MAZE_SIZE
+
+        # Endless mazes are built chunk by chunk as the player moves, so only level mode pre-generates mazes
+        self.mazeProducer = None
+        if ENDLESS_MODE:
+            # Load the window of the endless maze around the starting cell
+            seed = MAZE_SEED if MAZE_SEED is not None else random.getrandbits(32)
+            self.endlessMaze = ChunkedMaze(
+                seed, ENDLESS_CHUNK_SIZE, self.levelAlgorithm(1), ENDLESS_CACHE_CHUNKS
+            )
+            self.endlessExitsUsed = set()
+            self.loadEndlessWindow(1, 1)
+        else:
+            # Generate an initial maze and start building the next level's maze in the background
+            self.mazeProducer = MazeProducer()
+            self.maze, self.mazeEnd, self.viewCodes = buildMaze(
+                self.mazeSize,
+                self.levelSeed(self.mazeLevel),
+                self.levelAlgorithm(self.mazeLevel),
+            )
+            self.mazeProducer.request(
+                self.mazeSize,
+                self.levelSeed(self.mazeLevel + 1),
+                self.levelAlgorithm(self.mazeLevel + 1),
+            )
+        self.mazeHeight = len(self.maze)
+        self.mazeWidth = len(self.maze[0])
+
+        # position mini map in the top left of screen
+        self.miniMapBG = (
+            0,
+            0,
+            min(BLOCK_WIDTH * self.mazeHeight, MINIMAP_SIZE),
+            min(BLOCK_HEIGHT * self.mazeWidth, MINIMAP_SIZE),
+        )
+        self.minimapOverview = MINIMAP_OVERVIEW
+
+        # Pre-render the minimap and views for the initial maze
+        self.buildMinimap()
+        if VIEW_CACHE_WARMUP:
+            self.warmViewCache()
+
+    # Function to handle generating a new maze
+    def mazeGenerate(self):
+        # Close the timings of the level that was just finished
+        self.saveProfile()
+        # Increase the level
+        self.mazeLevel += 1
+        # The endless maze carries on - just retire the exit the player answered at
+        if ENDLESS_MODE:
+            self.endlessExitsUsed.add(self.endlessPosition())
+            self.loadEndlessWindow(*self.endlessPosition())
+            return
+        # Reset direction
+        self.dir = [-1, 0]
+        self.arrow_img = self.arrow_sheet[1]
+        self.arrow_rect = self.arrow_img.get_rect()
+        self.arrow_rect.x = BLOCK_WIDTH * 1
+        self.arrow_rect.y = BLOCK_HEIGHT * 1
+        # Swap in the pre-generated maze and start on the one after it
+        self.maze, self.mazeEnd, self.viewCodes = self.mazeProducer.take(
+            self.mazeSize,
+            self.levelSeed(self.mazeLevel),
+            self.levelAlgorithm(self.mazeLevel),
+        )
+        self.mazeProducer.request(
+            self.mazeSize,
+            self.levelSeed(self.mazeLevel + 1),
+            self.levelAlgorithm(self.mazeLevel + 1),
+        )
+        self.buildMinimap()
+        if VIEW_CACHE_WARMUP:
+            self.warmViewCache()
+
+    # Function to load the part of the endless maze centred on the player
+    def loadEndlessWindow(self, x, y):
+        """Loads a maze-sized window of the endless maze centred on grid cell (x, y) and moves the player there.
+
+        Args:
+            x (int): X-value of the player's grid cell in the endless maze
+            y (int): Y-value of the player's grid cell in the endless maze
+        """
+        side = self.mazeSize * 2 + 1
+        originX, originY = x - side // 2, y - side // 2
+        self.endlessOrigin = (originX, originY)
+        self.maze, end = self.endlessMaze.window(originX, originY, side, side)
+        self.mazeEnd = [
+            (endX, endY)
+            for endX, endY in end
+            if (endX + originX, endY + originY) not in self.endlessExitsUsed
+        ]
+        self.viewCodes = view_codes(self.maze)
+        self.buildMinimap()
+        # The minimap draws grid rows along x, so the arrow's x follows the grid y.
+        self.arrow_rect.x = (y - originY) * BLOCK_WIDTH
+        self.arrow_rect.y = (x - originX) * BLOCK_HEIGHT
+
+    # Helper function - returns the player's grid cell in the endless maze
+    def endlessPosition(self):
+        return (
+            self.endlessOrigin[0] + self.arrow_rect.y // BLOCK_HEIGHT,
+            self.endlessOrigin[1] + self.arrow_rect.x // BLOCK_WIDTH,
+        )
+
+    # Helper function - returns the seed for a level, or None when levels are random
+    def levelSeed(self, level):
+        if MAZE_SEED is None:
+            return None
+        return MAZE_SEED + level
+
+    # Helper function - returns the name of the generation algorithm used for a level
+    def levelAlgorithm(self, level):
+        return MAZE_ALGORITHMS[(level - 1) % len(MAZE_ALGORITHMS)]
+
+    # checks our direction and approprately turns left
+    def turnLeft(self):
+        # facing right
+        if self.dir == [1, 0]:
+            self.dir = [0, -1]
+        # facing left
+        elif self.dir == [-1, 0]:
+            self.dir = [0, 1]
+        # facing down
+        elif self.dir == [0, 1]:
+            self.dir = [1, 0]
+        # facing up
+        elif self.dir == [0, -1]:
+            self.dir = [-1, 0]
+
+    # checks our direction and approprately turns right
+    def turnRight(self):
+        # facing right
+        if self.dir == [1, 0]:
+            self.dir = [0, 1]
+        # facing left
+        elif self.dir == [-1, 0]:
+            self.dir = [0, -1]
+        # facing down
+        elif self.dir == [0, 1]:
+            self.dir = [-1, 0]
+        # facing up
+        elif self.dir == [0, -1]:
+            self.dir = [1, 0]
+
+    # Helper Function -  fuction to print out the 1's and 0's of a map
+    def printMap(self, maze):
+        printedMap = ""
+        for i in range(len(maze)):
+            for j in range(len(maze)):
+                printedMap += str(maze[i][j])
+            print(printedMap)
+            printedMap = ""
+
+    # Function to pre-render the minimap of the current maze into an off-screen surface
+    def buildMinimap(self):
+        # One pixel per grid cell, in one go - the minimap draws grid rows along x. What is on screen is scaled from
+        # this, so even the biggest mazes only take a few bytes per cell.
+        pixels = np.where(self.maze[..., None] == 1, BLACK, WHITE).astype(np.uint8)
+        self.minimapCells = pygame.surfarray.make_surface(pixels).convert()
+        self.minimapKey = None
+        self.minimapOverviewImage = None
+
+    # Function to redraw a single cell of the pre-rendered minimap after it changes
+    def updateMinimapCell(self, i, j):
+        self.minimapCells.set_at((i, j), BLACK if self.maze[i][j] == 1 else WHITE)
+        self.minimapKey = None
+        self.minimapOverviewImage = None
+
+    # Function to work out which part of the maze the minimap shows
+    def minimapView(self):
+        """Works out the part of the maze the minimap shows and how big its cells are.
+
+        Returns:
+            tuple: The grid cell (i, j) drawn at the minimap's top left corner, and the size of a cell in pixels
+        """
+        side = max(self.mazeHeight, self.mazeWidth)
+        if side * BLOCK_WIDTH <= MINIMAP_SIZE:
+            return (0, 0), BLOCK_WIDTH
+        if self.minimapOverview:
+            return (0, 0), MINIMAP_SIZE / side
+        # Centre the viewport on the player, but stop scrolling at the edges of the maze
+        visible = MINIMAP_SIZE // BLOCK_WIDTH
+        i, j = self.arrow_rect.x // BLOCK_WIDTH, self.arrow_rect.y // BLOCK_HEIGHT
+        return (
+            min(max(i - visible // 2, 0), self.mazeHeight - visible),
+            min(max(j - visible // 2, 0), self.mazeWidth - visible),
+        ), BLOCK_WIDTH
+
+    # Function to get the minimap image, scaling it from the pre-rendered cells only when the view changed
+    def minimapSurface(self):
+        view = self.minimapView()
+        if view != self.minimapKey:
+            self.minimapKey = view
+            (i, j), scale = view
+            if scale == BLOCK_WIDTH:
+                # Blow the visible cells up to blocks
+                visible = (
+                    min(MINIMAP_SIZE // BLOCK_WIDTH, self.mazeHeight),
+                    min(MINIMAP_SIZE // BLOCK_HEIGHT, self.mazeWidth),
+                )
+                self.minimap = pygame.transform.scale(
+                    self.minimapCells.subsurface((i, j, *visible)),
+                    (visible[0] * BLOCK_WIDTH, visible[1] * BLOCK_HEIGHT),
+                )
+            else:
+                # Average blocks of cells down into single pixels - dense areas of walls show up darker. This doesn't
+                # change as the player moves, so it is kept until the maze does.
+                if self.minimapOverviewImage is None:
+                    self.minimapOverviewImage = pygame.transform.smoothscale(
+                        self.minimapCells, (MINIMAP_SIZE, MINIMAP_SIZE)
+                    )
+                self.minimap = self.minimapOverviewImage
+        return self.minimap
+
+    # Helper function - returns the on-screen rect of grid cell (i, j) in the minimap, or None if it is out of view
+    def minimapCellRect(self, i, j):
+        (originI, originJ), scale = self.minimapView()
+        x, y = (i - originI) * scale, (j - originJ) * scale
+        if not (0 <= x < self.miniMapBG[2] and 0 <= y < self.miniMapBG[3]):
+            return None
+        return pygame.Rect(int(x), int(y), max(2, int(scale)), max(2, int(scale)))
+
+    # Helper function - returns where the arrow is drawn on the minimap
+    def minimapArrowRect(self):
+        cell = self.minimapCellRect(self.arrow_rect.x // BLOCK_WIDTH, self.arrow_rect.y // BLOCK_HEIGHT)
+        return self.arrow_img.get_rect(center=cell.center)
+
+    # Function to handle movement
+    def moveForward(self, direction):
+        # get current positon
+        pos = [self.arrow_rect.x // BLOCK_WIDTH, self.arrow_rect.y // BLOCK_HEIGHT]
+        # add direction we are facing
+        newPos = [pos[0] + direction[0], pos[1] + direction[1]]
+        # check if new position will put us out of bounds
+        if (
+            newPos[0] >= 0
+            and newPos[0] < self.mazeWidth
+            and newPos[1] >= 0
+            and newPos[1] < self.mazeHeight
+        ):
+            # check if new pssiton is a wall or not
+            if self.maze[newPos[0]][newPos[1]] != 1:
+                # move mini map character
+                self.arrow_rect.x = newPos[0] * BLOCK_WIDTH
+                self.arrow_rect.y = newPos[1] * BLOCK_HEIGHT
+                # re-centre the endless maze window before the player can see past its edge
+                if ENDLESS_MODE and not (
+                    ENDLESS_MARGIN <= newPos[0] < self.mazeWidth - ENDLESS_MARGIN
+                    and ENDLESS_MARGIN <= newPos[1] < self.mazeHeight - ENDLESS_MARGIN
+                ):
+                    self.loadEndlessWindow(*self.endlessPosition())
+
+    # method to animate dull long hall ways - UNUSED - MARK FOR DELETION?
+    def toggleAltWall(self, index):
+        # if index is at image 0 wich is a hallway and toggleAltHallway(toggled by Up_Arrow_key) is true
+        if index == 0 and self.toggleAltHallway:
+            # choose alternitive hallway image
+            return 41
+        else:
+            # other wise just return original index
+            return index
+
+    # Function to handle updating the maze view
+    def play_step(self):
+        self.updateProfilerOverlay()
+        self.ui()
+        with PROFILER.phase("view"):
+            self.updateView()
+
+    # Function to work out the view code and minimap arrow for the direction the player is facing
+    def updateView(self):
+        # The view from every cell is worked out when the maze is loaded, so this is just a lookup
+        heading = HEADINGS.index(tuple(self.dir))
+        self.wallView = int(
+            self.viewCodes[heading, self.arrow_rect.x // BLOCK_WIDTH, self.arrow_rect.y // BLOCK_HEIGHT]
+        )
+        self.arrow_img = self.arrow_sheet[ARROW_FRAMES[heading]]  # show correct mini-map arrow direction
+
+    # Function to render the maze view based on player position and direction
+    def renderWalls(self):
+        if self.raycast:
+            self.screen.blit(self.raycastView(), self.walls_rect)
+            return
+        # Every distinct wall view is composited once and then drawn with a single blit
+        self.screen.blit(self.cachedView(self.wallView), self.walls_rect)
+
+    # Function to get the raycast view from the player's cell, rendering it again only if the player moved or turned
+    def raycastView(self):
+        a, b = self.arrow_rect.x // BLOCK_WIDTH, self.arrow_rect.y // BLOCK_HEIGHT
+        key = (a, b, tuple(self.dir))
+        if self.rayMaze is not self.maze or self.rayKey != key:
+            self.rayMaze = self.maze
+            self.rayKey = key
+            if ENDLESS_MODE:
+                # The loaded window can end ENDLESS_MARGIN cells away, and the raycaster would take the edge for a
+                # wall, so cast against a window of the endless maze that covers the whole ray distance instead
+                x, y = self.endlessPosition()
+                reach = RAYCAST_DISTANCE + 1
+                grid, _ = self.endlessMaze.window(x - reach, y - reach, reach * 2 + 1, reach * 2 + 1)
+                pixels = self.raycaster.render(grid, (reach + 0.5, reach + 0.5), self.dir)
+            else:
+                pixels = self.raycaster.render(self.maze, (a + 0.5, b + 0.5), self.dir)
+            pygame.surfarray.blit_array(self.raySurface, pixels)
+        return self.raySurface
+
+    # Function to fetch the composited surface for a wall view from the cache, compositing it on a miss
+    def cachedView(self, wallView):
+        view = self.viewCache.get(wallView)
+        if view is not None:
+            self.viewCache.move_to_end(wallView)
+            return view
+        view = self.composeView(wallView)
+        self.viewCache[wallView] = view
+        # Drop the view that was used longest ago
+        if len(self.viewCache) > VIEW_CACHE_SIZE:
+            self.viewCache.popitem(last=False)
+        return view
+
+    # Function to composite the wall sprites for a wall view into a single surface
+    # renders some unseen walls but works for player - only runs once per distinct view now
+    def composeView(self, wallView):
+        # One character per cell of maze.view_offsets(), "1" for a wall
+        wallView = format(wallView, "012b")
+        view = pygame.Surface(self.walls_rect.size).convert()
+        view.fill(BLACK)
+
+        # always render background roof and floor
+        view.blit(self.walls_sheet[0], self.walls_offsets[0])
+
+        # row 4 ---------------------------------------------------------------
+        # render wall infront of player
+        if wallView[11] == "1":
+            view.blit(self.walls_sheet[18], self.walls_offsets[18])
+
+        # row 3 ---------------------------------------------------------------
+        # wall to player front left+2
+        if wallView[8] == "1":
+            # render its front face and side face
+            view.blit(self.walls_sheet[2], self.walls_offsets[2])
+            view.blit(self.walls_sheet[4], self.walls_offsets[4])
+        # wall to player front right+2
+        if wallView[10] == "1":
+            # render its front face and side face
+            view.blit(self.walls_sheet[1], self.walls_offsets[1])
+            view.blit(self.walls_sheet[5], self.walls_offsets[5])
+        # render wall infront of player
+        if wallView[9] == "1":
+            view.blit(self.walls_sheet[3], self.walls_offsets[3])
+
+        # row 2 ---------------------------------------------------------------
+        # wall to player front left+1
+        if wallView[5] == "1":
+            # render its front face and side face
+            view.blit(self.walls_sheet[6], self.walls_offsets[6])
+            view.blit(self.walls_sheet[8], self.walls_offsets[8])
+        # wall to player front right+1
+        if wallView[7] == "1":
+            # render its front face and side face
+            view.blit(self.walls_sheet[7], self.walls_offsets[7])
+            view.blit(self.walls_sheet[9], self.walls_offsets[9])
+        # render wall infront of player
+        if wallView[6] == "1":
+            view.blit(self.walls_sheet[12], self.walls_offsets[12])
+
+        # row 1 in front of player --------------------------------------------
+        # wall to player front left
+        if wallView[2] == "1":
+            # render its front face and side face
+            view.blit(self.walls_sheet[10], self.walls_offsets[10])
+            view.blit(self.walls_sheet[16], self.walls_offsets[16])
+        # wall to player front right
+        if wallView[4] == "1":
+            # render its front face and side face
+            view.blit(self.walls_sheet[11], self.walls_offsets[11])
+            view.blit(self.walls_sheet[17], self.walls_offsets[17])
+        # render wall directly infront of player
+        if wallView[3] == "1":
+            view.blit(self.walls_sheet[13], self.walls_offsets[13])
+
+        # row 0 containging player --------------------------------------------
+        # render wall to your left peripheral
+        if wallView[0] == "1":
+            view.blit(self.walls_sheet[15], self.walls_offsets[15])
+        # render wall to your right peripheral
+        if wallView[1] == "1":
+            view.blit(self.walls_sheet[14], self.walls_offsets[14])
+
+        return view
+
+    # Function to pre-composite the views the player can see anywhere in the current maze
+    def warmViewCache(self):
+        """Composites the views the player will see first, up to VIEW_CACHE_SIZE of them.
+
+        Even a small maze has hundreds of distinct views and each composited view is a full view-sized surface, so
+        they can't all be kept. Instead the open cells are visited in order of path distance from the player and the
+        views from them in every heading are composited until the cache is full. Views further away are composited
+        the first time they come up.
+        """
+        a, b = self.arrow_rect.x // BLOCK_WIDTH, self.arrow_rect.y // BLOCK_HEIGHT
+        # distance_field() takes (x, y) = (column, row), and the maze is indexed [a][b]
+        distances = distance_field(self.maze, (b, a))
+        reachable = np.flatnonzero(distances >= 0)
+        nearest = reachable[np.argsort(distances[reachable], kind="stable")]
+        wallViews = {}
+        for wallView in self.viewCodes.reshape(len(HEADINGS), -1)[:, nearest].T.ravel().tolist():
+            wallViews[wallView] = None
+            if len(wallViews) == VIEW_CACHE_SIZE:
+                break
+        # Composite the nearest views last, so they are the last to be evicted
+        for wallView in reversed(list(wallViews)):
+            self.cachedView(wallView)
+
+    # Helper function - returns True if the player is standing on one of the maze exits
+    def atExit(self):
+        pos = (self.arrow_rect.y // BLOCK_WIDTH, self.arrow_rect.x // BLOCK_HEIGHT)
+        return pos in self.mazeEnd
+
+    # Function to force the next renderDirty() call to redraw the whole screen
+    def invalidate(self):
+        self.lastRendered = None
+
+    # Function to redraw only the parts of the screen that changed since the last call
+    def renderDirty(self, prompt=None):
+        """Redraws the regions of the screen whose state changed since the previous call.
+
+        The 3D view, the minimap cells under the old and new arrow, the HUD text and the question panel are tracked
+        separately. A new maze or a change of dev mode redraws everything.
+
+        Args:
+            prompt (tuple): The (question, answerChars) on display, or None if no question is shown
+
+        Returns:
+            list: The rects that were redrawn and need to be pushed with pygame.display.update()
+        """
+        self.updateProfilerOverlay()
+        panel = None
+        if prompt is not None:
+            prompt = (prompt[0], tuple(sorted(prompt[1].items())))
+            if getattr(self, "questionLayoutKey", None) != prompt:
+                self.questionLayoutKey = prompt
+                self.questionPanel, self.questionSurface = self.renderQuestionPanel(prompt[0], dict(prompt[1]))
+            panel = self.questionPanel
+        state = {
+            "maze": id(self.maze),
+            "devMode": devMode,
+            # The raycaster sees further than the wall view, so any move or turn can change it
+            "view": ("raycast", self.arrow_rect.topleft, tuple(self.dir)) if self.raycast else self.wallView,
+            "arrow": (self.minimapArrowRect(), id(self.arrow_img)),
+            "minimap": self.minimapView(),
+            "hud": (self.mazeLevel, self.scorePercent, self.lives),
+            "prompt": prompt,
+            "panel": panel,
+            "profiler": self.profilerLines if devMode and self.showProfiler else None,
+        }
+        last = getattr(self, "lastRendered", None)
+        self.lastRendered = state
+
+        if last is None or last["maze"] != state["maze"] or last["devMode"] != state["devMode"]:
+            rects = [self.screen.get_rect()]
+        else:
+            rects = []
+            if last["view"] != state["view"]:
+                rects.append(self.walls_rect.copy())
+            if last["minimap"] != state["minimap"]:
+                rects.append(pygame.Rect(self.miniMapBG))
+            if last["arrow"] != state["arrow"]:
+                rects.extend((last["arrow"][0], state["arrow"][0]))
+            if last["hud"] != state["hud"]:
+                rects.append(pygame.Rect(0, MINIMAP_SIZE, self.walls_rect.x, 75))
+            if last["prompt"] != state["prompt"]:
+                # The panel can grow upwards for long questions, so cover both the old and the new panel
+                top = max(400, MINIMAP_SIZE)
+                for panel in (last["panel"], state["panel"]):
+                    if panel is not None:
+                        top = min(top, panel.top)
+                rects.append(pygame.Rect(0, top, WIDTH, HEIGHT - top))
+            if last["profiler"] != state["profiler"]:
+                rects.append(self.profilerRect.copy())
+
+        # Draw the full frame clipped to each region, so overlapping elements keep their usual stacking order.
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.ui()
+            if prompt is not None:
+                self.questionPrompt(prompt[0], dict(prompt[1]))
+        self.screen.set_clip(None)
+        return rects
+
+    # Function to handle the user interface elements
+    def ui(self):
+        # Render screen
+        self.screen.fill(BLACK)
+
+        # Render 3d maze - skipped when a dirty-region redraw is clipped away from it
+        if self.screen.get_clip().colliderect(self.walls_rect):
+            with PROFILER.phase("walls"):
+                self.renderWalls()
+
+        with PROFILER.phase("minimap"):
+            # Render the part of the pre-rendered mini map that is in view
+            self.screen.blit(self.minimapSurface(), (self.miniMapBG[0], self.miniMapBG[1]))
+
+            # Render the end point in red - For testing and development purposes
+            if devMode:
+                for item in self.mazeEnd:
+                    end_y, end_x = item
+                    endRect = self.minimapCellRect(end_x, end_y)
+                    if endRect is not None:
+                        pygame.draw.rect(self.screen, RED, endRect)
+
+        with PROFILER.phase("text"):
+            # Render text to show level
+            levelText = TEXT_CACHE.render(f"Level: {self.mazeLevel}", WHITE)
+            self.screen.blit(levelText, (10, MINIMAP_SIZE))
+
+            # Render text to show score
+            scoreText = TEXT_CACHE.render(f"Score: {self.scorePercent:.2f}%", WHITE)
+            self.screen.blit(scoreText, (10, (MINIMAP_SIZE + 25)))
+
+            # Render text to show lives
+            livesText = TEXT_CACHE.render(f"Lives: " + ("♥️ " * self.lives), WHITE)
+            self.screen.blit(livesText, (10, (MINIMAP_SIZE + 50)))
+
+        # Render question background
+        qBkgTopLeftY = max(400, MINIMAP_SIZE + 75)
+        qBkgTopLeftX = 10
+        qBkgRect = pygame.Rect(
+            qBkgTopLeftX,
+            qBkgTopLeftY,
+            (WIDTH - 20),
+            130,
+        )
+        pygame.draw.rect(
+            self.screen,
+            DARK_WHITE,
+            qBkgRect,
+        )
+
+        # Render mini map green arrow character
+        self.screen.blit(self.arrow_img, self.minimapArrowRect())
+
+        # Render frame timings over the 3D view - For testing and development purposes
+        if devMode and self.showProfiler:
+            self.drawProfiler()
+
+    # Function to refresh the numbers shown in the performance overlay every PROFILER_REFRESH seconds
+    def updateProfilerOverlay(self):
+        if not (devMode and self.showProfiler):
+            return
+        now = pygame.time.get_ticks() / 1000
+        if self.profilerLines and now - self.profilerRefreshed < PROFILER_REFRESH:
+            return
+        self.profilerRefreshed = now
+        stats = PROFILER.stats()
+        lines = [f"{'ms':<9}{'p50':>7}{'p90':>7}{'p99':>7}"]
+        for name in PROFILER_PHASES:
+            if name in stats:
+                phase = stats[name]
+                lines.append(
+                    f"{name:<9}{phase['median'] * 1000:7.2f}{phase['p90'] * 1000:7.2f}{phase['p99'] * 1000:7.2f}"
+                )
+        # Only re-render the text when the numbers actually changed
+        if tuple(lines) != self.profilerLines:
+            self.profilerLines = tuple(lines)
+            self.profilerSurfaces = [DEFAULT_FONT.render(line, False, GREEN) for line in lines]
+
+    # Function to draw the performance overlay
+    def drawProfiler(self):
+        height = 20 * len(self.profilerSurfaces) + 10
+        pygame.draw.rect(
+            self.screen, BLACK, (self.profilerRect.x, self.profilerRect.y, self.profilerRect.width, height)
+        )
+        for row, surface in enumerate(self.profilerSurfaces):
+            self.screen.blit(surface, (self.profilerRect.x + 10, self.profilerRect.y + 5 + 20 * row))
+
+    # Function to stop the background workers on quit, dropping any maze or question they haven't started on
+    def shutdown(self):
+        if self.mazeProducer is not None:
+            self.mazeProducer.shutdown()
+        self.questionPrefetcher.shutdown(wait=False, cancel_futures=True)
+        self.nextQuestion = None
+        self.nextPanel = None
+
+    # Function to close the frame timings of the current level and write them out if PROFILE_OUTPUT is set
+    def saveProfile(self):
+        PROFILER.end_level(self.mazeLevel)
+        if PROFILE_OUTPUT:
+            PROFILER.dump(PROFILE_OUTPUT)
+
+    """ These functions handle the question retrieval, answers and rendering. """
+
+    # Function to pick a question and shuffle its answers - safe to run on the prefetch thread
+    def pickQuestion(self):
+        if QUESTION_SCHEDULER is not None:
+            scheduler = QUESTION_SCHEDULER.load()
+            # Aim at the tier that matches the player's level
+            scheduler.focus = min((self.mazeLevel - 1) // LEVELS_PER_TIER, len(scheduler.tiers) - 1)
+            chosen = scheduler.draw()
+        else:
+            # The next unseen question, working through the question files in order
+            chosen = QUESTION_BANK.draw()
+        if chosen is None:
+            return None
+
+        question = chosen.text
+        correctAnswer = chosen.correct
+        possChars = [
+            "a",
+            "b",
+            "c",
+            "d",
+        ]
+        corrChar = random.choice(possChars)
+        possChars.remove(corrChar)
+        wrongAnswers = list(chosen.wrong)
+        random.shuffle(possChars)
+        random.shuffle(wrongAnswers)
+        answerChars = {
+            corrChar: correctAnswer,
+        }
+        for i in range(3):
+            answerChars[possChars[i]] = wrongAnswers[i]
+
+        return chosen, question, answerChars, corrChar
+
+    # Function to get the next question ready while the player walks towards an exit
+    def prefetchQuestion(self):
+        """Starts picking the next question on the prefetch thread once the player is within
+        QUESTION_PREFETCH_DISTANCE cells of an exit, and renders its panel once the pick is done.
+
+        Fonts aren't safe to use from two threads at once, so the panel is rendered here on the main thread, in the
+        frames between reaching the exit, rather than on the worker.
+        """
+        if self.nextQuestion is None:
+            pos = (self.arrow_rect.y // BLOCK_WIDTH, self.arrow_rect.x // BLOCK_HEIGHT)
+            if any(abs(pos[0] - end[0]) + abs(pos[1] - end[1]) <= QUESTION_PREFETCH_DISTANCE for end in self.mazeEnd):
+                self.nextQuestion = self.questionPrefetcher.submit(self.pickQuestion)
+        elif self.nextPanel is None and self.nextQuestion.done():
+            picked = self.nextQuestion.result()
+            if picked is not None:
+                with PROFILER.phase("question"):
+                    self.nextPanel = self.renderQuestionPanel(picked[1], picked[2])
+
+    # Function to select a question
+    def choseQuestion(self):
+        if self.nextQuestion is not None:
+            # Prefetched - the pick only takes a moment, so waiting for one still in progress is cheap
+            picked = self.nextQuestion.result()
+            panel = self.nextPanel
+            self.nextQuestion = None
+            self.nextPanel = None
+        else:
+            picked = self.pickQuestion()
+            panel = None
+        if picked is None:
+            self.shutdown()
+            pygame.quit()
+            sys.exit("YOU WIN")
+
+        chosen, question, answerChars, corrChar = picked
+        self.currentQuestion = chosen
+
+        # Use the panel rendered while walking, or render it now rather than every frame it is on screen
+        self.questionLayoutKey = (question, tuple(sorted(answerChars.items())))
+        if panel is None:
+            panel = self.renderQuestionPanel(question, answerChars)
+        self.questionPanel, self.questionSurface = panel
+
+        return question, answerChars, corrChar
+
+    # Function to tell the scheduler how the player answered the current question
+    def answerQuestion(self, correct: bool):
+        if QUESTION_SCHEDULER is not None and self.currentQuestion is not None:
+            QUESTION_SCHEDULER.answered(self.currentQuestion, correct)
+
+    # Function to lay out and render the question panel once per question
+    def layoutQuestion(self, question: str, answerChars: dict):
+        """Wraps the question and answers to the panel width, sizes the panel to fit and renders every line.
+
+        The panel grows upwards from its usual position when the text needs more room than the space below it.
+
+        Args:
+            question (str): The question text
+            answerChars (dict): The answers by letter
+
+        Returns:
+            tuple: The panel rect and a list of (surface, (x, y)) pairs to blit on it
+        """
+        qBkgTopLeftX = 10
+        textWidth = WIDTH - 40
+
+        # (text, x offset) for every line - answers get a hanging indent past their letter
+        rows = [(line, 0) for line in TEXT_CACHE.wrap(question, textWidth)]
+        for char in ("a", "b", "c", "d"):
+            prefix = f"{char}. "
+            indent = TEXT_CACHE.wordWidth(prefix)
+            answerLines = TEXT_CACHE.wrap(answerChars[char], textWidth - indent)
+            rows.append((prefix + answerLines[0], 0))
+            rows.extend((line, indent) for line in answerLines[1:])
+
+        qBkgHeight = max(130, 20 * len(rows) + 10)
+        qBkgTopLeftY = max(400, MINIMAP_SIZE)
+        if qBkgTopLeftY + qBkgHeight > HEIGHT - 10:
+            qBkgTopLeftY = max(0, HEIGHT - 10 - qBkgHeight)
+        qBkgRect = pygame.Rect(qBkgTopLeftX, qBkgTopLeftY, (WIDTH - 20), qBkgHeight)
+
+        return qBkgRect, [
+            (
+                DEFAULT_FONT.render(line, False, WHITE),
+                ((qBkgTopLeftX + 10 + indent), (qBkgTopLeftY + 10 + 20 * row)),
+            )
+            for row, (line, indent) in enumerate(rows)
+        ]
+
+    # Function to render the question panel onto a surface of its own
+    def renderQuestionPanel(self, question: str, answerChars: dict):
+        panelRect, layout = self.layoutQuestion(question, answerChars)
+        panel = pygame.Surface(panelRect.size).convert()
+        panel.fill(DARK_WHITE)
+        for surface, (x, y) in layout:
+            panel.blit(surface, (x - panelRect.x, y - panelRect.y))
+        return panelRect, panel
+
+    # Function to handle displaying the question
+    def questionPrompt(self, question: str, answerChars: dict):
+        # Display question and answers - rendered in choseQuestion(), or here if this is a different question
+        with PROFILER.phase("question"):
+            key = (question, tuple(sorted(answerChars.items())))
+            if getattr(self, "questionLayoutKey", None) != key:
+                self.questionLayoutKey = key
+                self.questionPanel, self.questionSurface = self.renderQuestionPanel(question, answerChars)
+            self.screen.blit(self.questionSurface, self.questionPanel)
+
+
+# Keys a headless input script can press, by name
+SCRIPT_KEYS = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "up": pygame.K_UP,
+    "space": pygame.K_SPACE,
+    "a": pygame.K_a,
+    "b": pygame.K_b,
+    "c": pygame.K_c,
+    "d": pygame.K_d,
+    "z": pygame.K_z,
+    "m": pygame.K_m,
+    "p": pygame.K_p,
+    "r": pygame.K_r,
+    "q": pygame.K_q,
+}
+# Input script used by headless runs when none is given - it repeats until the frames run out
+DEFAULT_SCRIPT = "up*3 left up*3 right up*3 right up*3 left space answer"
+
+
+# Function to read a headless input script
+def parseScript(script):
+    """Turns an input script into the list of inputs to send, one per frame.
+
+    A script is a list of tokens separated by spaces or commas. Each token is a key name from SCRIPT_KEYS, "answer"
+    for the correct answer to the question on screen or "wait" for a frame without a key press, and "token*n"
+    repeats a token n times. A script starting with @ is read from the file named after it.
+
+    Args:
+        script (str): The script, or @ followed by the file holding it
+
+    Returns:
+        list: The token to send on each frame
+    """
+    if script.startswith("@"):
+        with open(script[1:], "r") as scriptFile:
+            script = scriptFile.read()
+    tokens = []
+    for token in script.replace(",", " ").split():
+        name, _, count = token.lower().partition("*")
+        if name not in SCRIPT_KEYS and name not in ("answer", "wait"):
+            raise ValueError(f"unknown key {name!r} in input script")
+        if count and not count.isdigit():
+            raise ValueError(f"bad repeat count in {token!r}")
+        tokens.extend([name] * (int(count) if count else 1))
+    if not tokens:
+        raise ValueError("input script is empty")
+    return tokens
+
+
+# Function to run the main game loop
+def playGame(game, script=None, frames=None):
+    """Runs the game until the player quits, wins or loses.
+
+    Args:
+        game (Game): The game to play
+        script (list): Inputs to send instead of waiting for the player, one per frame, as returned by parseScript().
+            Scripted runs repeat the script, don't cap the frame rate and return after the given number of frames.
+        frames (int): Number of frames to run a script for
+    """
+    global devMode, questionsRight
+    # Initialize global question vars.
+    questionActive = False
+    question = None
+    answerDict = None
+    correctAnswer = None
+    eventsTimer = PROFILER.phase("events")
+    PROFILER.start_frame()
+    frame = 0
+    # Main game loop
+    while True:
+        if not questionActive:
+            game.prefetchQuestion()
+
+        # Queue the next scripted input, so it goes through the same event handling as a real key press
+        if script is not None:
+            if frame == frames:
+                return
+            token = script[frame % len(script)]
+            if token == "wait":
+                pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+            else:
+                key = ord(correctAnswer or "a") if token == "answer" else SCRIPT_KEYS[token]
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+            frame += 1
+
+        if DIRTY_RENDERING:
+            # Push only the regions that changed, then sleep until input arrives instead of redrawing every frame
+            with PROFILER.phase("view"):
+                game.updateView()
+            prompt = (question, answerDict) if questionActive and game.atExit() else None
+            dirtyRects = game.renderDirty(prompt)
+            if dirtyRects:
+                with PROFILER.phase("flip"):
+                    pygame.display.update(dirtyRects)
+            # Time spent waiting for input isn't part of the frame
+            PROFILER.end_frame()
+            events = [pygame.event.wait()] + pygame.event.get()
+            PROFILER.start_frame()
+        else:
+            events = pygame.event.get()
+
+        eventsTimer.start()
+        keys = pygame.key.get_pressed()
+        if not devMode:
+            if keys[pygame.K_LCTRL] and keys[pygame.K_RSHIFT]:
+                devMode = True
+                print("Dev Mode active")
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                game.saveProfile()
+                game.shutdown()
+                pygame.quit()
+                sys.exit()
+
+            # The window contents were lost (e.g. uncovered), so the next dirty-region pass must redraw everything
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                game.invalidate()
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT and questionActive == False:
+                    game.turnLeft()
+
+                if event.key == pygame.K_RIGHT and questionActive == False:
+                    game.turnRight()
+
+                if event.key == pygame.K_UP and questionActive == False:
+                    # alternate image displayed for long hallways - UNUSED alt image
+                    game.toggleAltHallway = not game.toggleAltHallway
+                    game.moveForward(game.dir)
+
+                if event.key == pygame.K_SPACE and not questionActive:
+                    pos = (
+                        game.arrow_rect.y // BLOCK_WIDTH,
+                        game.arrow_rect.x // BLOCK_HEIGHT,
+                    )
+                    if pos in game.mazeEnd:
+                        question, answerDict, correctAnswer = game.choseQuestion()
+                        questionActive = True
+
+                if event.key == pygame.K_q:
+                    game.saveProfile()
+                    game.shutdown()
+                    pygame.quit()
+                    sys.exit()
+
+                if event.key == pygame.K_z and devMode:
+                    # Debug re-generate maze to quicken testing - potentially remove or obfuscate
+                    game.mazeGenerate()
+
+                if event.key == pygame.K_a and questionActive == True:
+                    # Check if letter chosen is the same as the correct answer.
+                    # If it is, increase score, set questionActive to false, and generate a new maze
+                    # If not, get a new question.
+                    if correctAnswer == "a":
+                        game.answerQuestion(True)
+                        questionsRight += 1
+                        game.scorePercent = (questionsRight / QUESTION_BANK.total) * 100
+                        questionActive = False
+                        if game.lives < 3:
+                            game.lives += 1
+                        game.mazeGenerate()
+                    else:
+                        game.answerQuestion(False)
+                        if not devMode:
+                            game.lives -= 1
+                        if game.lives <= 0:
+                            game.saveProfile()
+                            game.shutdown()
+                            pygame.quit()
+                            # Print score and level
+                            sys.exit("Game Over")
+                        else:
+                            question, answerDict, correctAnswer = game.choseQuestion()
+
+                if event.key == pygame.K_b and questionActive == True:
+                    # Check if letter chosen is the same as the correct answer.
+                    # If it is, increase score, set questionActive to false, and generate a new maze
+                    # If not, get a new question.
+                    if correctAnswer == "b":
+                        game.answerQuestion(True)
+                        questionsRight += 1
+                        game.scorePercent = (questionsRight / QUESTION_BANK.total) * 100
+                        questionActive = False
+                        if game.lives < 3:
+                            game.lives += 1
+                        game.mazeGenerate()
+                    else:
+                        game.answerQuestion(False)
+                        if not devMode:
+                            game.lives -= 1
+                        if game.lives <= 0:
+                            game.saveProfile()
+                            game.shutdown()
+                            pygame.quit()
+                            # Print score and level
+                            sys.exit("Game Over")
+                        else:
+                            question, answerDict, correctAnswer = game.choseQuestion()
+
+                if event.key == pygame.K_c and questionActive == True:
+                    # Check if letter chosen is the same as the correct answer.
+                    # If it is, increase score, set questionActive to false, and generate a new maze
+                    # If not, get a new question.
+                    if correctAnswer == "c":
+                        game.answerQuestion(True)
+                        questionsRight += 1
+                        game.scorePercent = (questionsRight / QUESTION_BANK.total) * 100
+                        questionActive = False
+                        if game.lives < 3:
+                            game.lives += 1
+                        game.mazeGenerate()
+                    else:
+                        game.answerQuestion(False)
+                        if not devMode:
+                            game.lives -= 1
+                        if game.lives <= 0:
+                            game.saveProfile()
+                            game.shutdown()
+                            pygame.quit()
+                            # Print score and level
+                            sys.exit("Game Over")
+                        else:
+                            question, answerDict, correctAnswer = game.choseQuestion()
+
+                if event.key == pygame.K_d and questionActive == True:
+                    # Check if letter chosen is the same as the correct answer.
+                    # If it is, increase score, set questionActive to false, and generate a new maze
+                    # If not, get a new question.
+                    if correctAnswer == "d":
+                        game.answerQuestion(True)
+                        questionsRight += 1
+                        game.scorePercent = (questionsRight / QUESTION_BANK.total) * 100
+                        questionActive = False
+                        if game.lives < 3:
+                            game.lives += 1
+                        game.mazeGenerate()
+                    else:
+                        game.answerQuestion(False)
+                        if not devMode:
+                            game.lives -= 1
+                        if game.lives <= 0:
+                            game.saveProfile()
+                            game.shutdown()
+                            pygame.quit()
+                            # Print score and level
+                            sys.exit("Game Over")
+                        else:
+                            question, answerDict, correctAnswer = game.choseQuestion()
+
+                if event.key == pygame.K_p and devMode:
+                    # Show or hide the frame timings overlay
+                    game.showProfiler = not game.showProfiler
+
+                if event.key == pygame.K_m:
+                    # Switch a big maze's minimap between the viewport around the player and the whole maze
+                    game.minimapOverview = not game.minimapOverview
+
+                if event.key == pygame.K_r and devMode:
+                    # Switch the 3D view between the wall sprites and the raycaster
+                    game.raycast = not game.raycast
+        eventsTimer.stop()
+
+        if not DIRTY_RENDERING:
+            game.play_step()
+            if questionActive:
+                pos = (
+                    game.arrow_rect.y // BLOCK_WIDTH,
+                    game.arrow_rect.x // BLOCK_HEIGHT,
+                )
+                if pos in game.mazeEnd:
+                    game.questionPrompt(question, answerDict)
+            with PROFILER.phase("flip"):
+                pygame.display.flip()
+            # Time spent sleeping to hold 60 FPS isn't part of the frame
+            PROFILER.end_frame()
+            if script is None:
+                game.clock.tick(60)
+            PROFILER.start_frame()
+
+
+# Function to start the game from the command line
+def main(argv=None):
+    """Starts the game, or with --headless runs it on SDL's dummy video driver with scripted input.
+
+    A headless run plays the real game for --frames frames as fast as it can and then reports the frame rate and the
+    cost of every phase of a frame as JSON.
+
+    Args:
+        argv (list): Command line arguments, defaults to sys.argv[1:]
+    """
+    global devMode, MAZE_SEED, PROFILER
+    parser = argparse.ArgumentParser(description="Mind Maze!")
+    parser.add_argument("--headless", action="store_true", help="run without a window, using --script as input")
+    parser.add_argument("--frames", type=int, default=600, help="frames to run a headless game for")
+    parser.add_argument(
+        "--script",
+        default=DEFAULT_SCRIPT,
+        help="inputs for a headless run, e.g. 'up*3 left space answer', or @file to read them from a file",
+    )
+    parser.add_argument("--seed", type=int, help="generate level n from seed + n (and seed question selection)")
+    parser.add_argument("--dev", action="store_true", help="start in dev mode")
+    parser.add_argument("--report", help="write the headless report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    # Headless runs use SDL's dummy drivers, which have to be picked before pygame starts
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if args.seed is not None:
+        MAZE_SEED = args.seed
+        random.seed(args.seed)
+    devMode = devMode or args.dev
+    QUESTION_BANK.load()
+    if not args.headless:
+        playGame(Game())
+        return
+
+    try:
+        script = parseScript(args.script)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    # Keep every frame of the run for the report, not just the recent ones
+    PROFILER = FrameProfiler(window=max(1, args.frames))
+    game = Game()
+    started = time.perf_counter()
+    try:
+        playGame(game, script, args.frames)
+        outcome = "finished"
+    except SystemExit as exit:
+        # Winning, losing and pressing q all end the run early
+        outcome = str(exit.code) if exit.code else "quit"
+    elapsed = time.perf_counter() - started
+    # Quitting already stopped the workers, but a run that used up its frames leaves them going
+    game.shutdown()
+
+    report = {
+        "frames": PROFILER.frames,
+        "seconds": elapsed,
+        "frames_per_second": PROFILER.frames / elapsed if elapsed else 0.0,
+        "level": game.mazeLevel,
+        "outcome": outcome,
+        "phases": {
+            name: {(key if key == "count" else f"{key}_ms"): (value if key == "count" else value * 1000)
+                   for key, value in stats.items()}
+            for name, stats in PROFILER.stats().items()
+        },
+    }
+    text = json.dumps(report, indent=2)
+    if args.report:
+        with open(args.report, "w") as reportFile:
+            reportFile.write(text + "\n")
+    else:
+        print(text)
+
+
+# Run the game when this module is executed directly - python -m mindmaze and main.py start it through main() too
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import threading
+
+"""
+Lazily created resources.
+
+Fonts, sprite sheets and the question bank are slow to load and need pygame to be running, so rather than loading
+them when the game module is imported they are wrapped in a Lazy and created the first time something uses them:
+
+    DEFAULT_FONT = Lazy(loadFont)
+    DEFAULT_FONT.render(...)  # loads the font, then renders with it
+
+Attribute reads are passed on to the resource, so code can use a Lazy as if it were the resource itself. load()
+returns the resource for anything else, such as setting attributes or unpacking a tuple.
+"""
+
+
+# Class to create a resource the first time it is used
+class Lazy:
+    # Initialization function
+    def __init__(self, factory):
+        """Wraps a resource without creating it.
+
+        Args:
+            factory (callable): Function that takes no arguments and returns the resource
+        """
+        self._factory = factory
+        self._value = None
+        self._loaded = False
+        # The question bank is first used from the prefetch thread, so two threads can ask at the same time
+        self._lock = threading.Lock()
+
+    # Function to get the resource, creating it if this is the first use
+    def load(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._value = self._factory()
+                    self._loaded = True
+        return self._value
+
+    # Function to check whether the resource has been created yet
+    def loaded(self):
+        return self._loaded
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
@@ -0,0 +1,633 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import random
+from array import array
+from collections import OrderedDict, deque
+
+import numpy as np
+
+"""
+Maze generation.
+
+A maze of size n is stored as a (2n + 1) x (2n + 1) uint8 grid where 1 is a wall and 0 is a path. Cell (x, y) of the
+maze sits at grid[2y + 1, 2x + 1] and the grid entries between two cells are the walls that separate them. Every
+generator below carves a perfect maze into that same grid format, after which Maze.generate() opens some extra walls
+and places the exits.
+"""
+
+# Directions to the four neighbors of a cell
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+# Headings the player can face, as steps along the grid's (first, second) axes - the index into view_codes()
+HEADINGS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+# Number of shuffled walls KruskalGenerator turns into Python ints at once
+KRUSKAL_CHUNK = 1 << 16
+
+
+# Function to measure path distances across a maze grid
+def distance_field(grid, start=(1, 1)):
+    """Runs a breadth-first search over the paths of a grid.
+
+    The grid's outer border must be walls, which is true of every generated maze.
+
+    Args:
+        grid (numpy.ndarray): Maze grid where 1 is wall and 0 is path
+        start (tuple): The x,y grid coordinates the distances are measured from
+
+    Returns:
+        numpy.ndarray: Flat int32 array where entry y * width + x is the number of steps from start to grid cell
+        (x, y), or -1 for walls and unreachable cells.
+    """
+    height, width = grid.shape
+    cells = np.ascontiguousarray(grid, dtype=np.uint8).tobytes()
+    distances = array("i", [-1]) * (height * width)
+    origin = start[1] * width + start[0]
+    if not cells[origin]:
+        distances[origin] = 0
+        queue = deque([origin])
+        steps = (-width, width, -1, 1)
+        while queue:
+            cell = queue.popleft()
+            nextDistance = distances[cell] + 1
+            for step in steps:
+                neighbor = cell + step
+                if not cells[neighbor] and distances[neighbor] < 0:
+                    distances[neighbor] = nextDistance
+                    queue.append(neighbor)
+    return np.frombuffer(distances, dtype=np.intc).astype(np.int32, copy=False)
+
+
+# Function to list the grid cells that make up the view along a heading
+def view_offsets(heading, depth=4):
+    """Lists the offsets from the player of the cells that decide what the first-person view looks like.
+
+    The order is the bit order of a view code, most significant first: left and right of the player, then left, front
+    and right for each of the next depth - 1 cells ahead, then the cell depth steps straight ahead. For the default
+    depth this is the 12-character wall view the wall sprites are drawn from.
+
+    Args:
+        heading (tuple): Step along the grid's (first, second) axes the player is facing
+        depth (int): Number of cells the player can see ahead
+
+    Returns:
+        list: The (first, second) axis offsets of every cell, 3 * depth in all
+    """
+    forwardA, forwardB = heading
+    # Left of the heading, in the same axes
+    leftA, leftB = forwardB, -forwardA
+    offsets = [(leftA, leftB), (-leftA, -leftB)]
+    for step in range(1, depth):
+        aheadA, aheadB = forwardA * step, forwardB * step
+        offsets.extend(
+            [(aheadA + leftA, aheadB + leftB), (aheadA, aheadB), (aheadA - leftA, aheadB - leftB)]
+        )
+    offsets.append((forwardA * depth, forwardB * depth))
+    return offsets
+
+
+# Function to work out the view from every cell of a maze in every heading
+def view_codes(grid, depth=4):
+    """Computes the view code of every grid cell for each of the four headings at once.
+
+    Bit i of a code, counting from the most significant of its 3 * depth bits, is 1 if the cell at view_offsets()[i]
+    is a wall. Cells outside the grid count as walls. Every bit is computed for the whole grid with one shifted
+    comparison, so looking up the view during play is a single array index.
+
+    Args:
+        grid (numpy.ndarray): Maze grid where 1 is wall and 0 is path
+        depth (int): Number of cells the player can see ahead
+
+    Returns:
+        numpy.ndarray: Array of shape (4, height, width) where [h, a, b] is the code for facing HEADINGS[h] from
+        grid[a, b]. Codes of wall cells are meaningless.
+    """
+    bits = 3 * depth
+    if bits > 64:
+        raise ValueError(f"view depth {depth} needs more than 64 bits")
+    dtype = np.uint16 if bits <= 16 else np.uint32 if bits <= 32 else np.uint64
+    grid = np.asarray(grid)
+    height, width = grid.shape
+    # Pad with walls so every shifted window stays inside the array
+    walls = np.ones((height + 2 * depth, width + 2 * depth), dtype=dtype)
+    walls[depth : depth + height, depth : depth + width] = grid != 0
+    codes = np.zeros((len(HEADINGS), height, width), dtype=dtype)
+    for h, heading in enumerate(HEADINGS):
+        code = codes[h]
+        for offsetA, offsetB in view_offsets(heading, depth):
+            code <<= 1
+            code |= walls[depth + offsetA : depth + offsetA + height, depth + offsetB : depth + offsetB + width]
+    return codes
+
+
+# Helper function - opens cell (x2, y2) and the wall between it and its neighbor (x1, y1) in a flat grid buffer
+def carve_path(cells, side, x1, y1, x2, y2):
+    first = (y1 * 2 + 1) * side + x1 * 2 + 1
+    second = (y2 * 2 + 1) * side + x2 * 2 + 1
+    # The wall between two neighboring cells sits halfway between them in the flat grid too.
+    cells[(first + second) // 2] = 0
+    cells[second] = 0
+
+
+# Class to handle an array-backed union-find (disjoint set) over the integers 0..n-1
+class UnionFind:
+    # Initialization function
+    def __init__(self, n):
+        self.parent = array("i", range(n))
+        self.rank = bytearray(n)
+
+    # Function to find the representative of the set containing item
+    def find(self, item):
+        parent = self.parent
+        # Path halving - point every other node on the way up at its grandparent.
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    # Function to merge the sets containing a and b. Returns False if they were already the same set.
+    def union(self, a, b):
+        rootA, rootB = self.find(a), self.find(b)
+        if rootA == rootB:
+            return False
+        if self.rank[rootA] < self.rank[rootB]:
+            rootA, rootB = rootB, rootA
+        self.parent[rootB] = rootA
+        if self.rank[rootA] == self.rank[rootB]:
+            self.rank[rootA] += 1
+        return True
+
+
+# Class that every maze generation algorithm derives from
+class MazeGenerator:
+    # Name the algorithm is selected and cached by
+    name = None
+
+    # Function to carve a perfect maze into maze.grid using maze.rng
+    def carve(self, maze):
+        raise NotImplementedError
+
+
+# Randomized depth-first search (recursive backtracker) - long winding corridors
+class DepthFirstGenerator(MazeGenerator):
+    name = "dfs"
+
+    # Function to enumerate the cells directly adjacent to a specified cell
+    def get_neighbors(self, maze, visited, x, y):
+        """Enumerates the unvisited cells that are directly adjacent to a specified cell.
+
+        Args:
+            maze (Maze): Maze being carved
+            visited (bytearray): Visited flags indexed by y * size + x
+            x (int): X-value of the specified cell
+            y (int): Y-value of the specified cell
+
+        Returns:
+            list: List that contains the neighbors of the cell, in a randomized order
+        """
+        size = maze.size
+        neighbors = []
+        directions = list(DIRECTIONS)
+        maze.rng.shuffle(directions)
+        for dx, dy in directions:
+            nx, ny = x + dx, y + dy
+            # Bounds are checked inline - this runs four times per cell and the method call was a tenth of the carve.
+            if 0 <= nx < size and 0 <= ny < size and not visited[ny * size + nx]:
+                neighbors.append((nx, ny))
+        return neighbors
+
+    # Function to carve the maze
+    def carve(self, maze):
+        # Visited flags are a flat bytearray indexed by y * size + x, which keeps the per-step lookups cheap.
+        visited = bytearray(maze.size * maze.size)
+        # Paths are carved into a flat copy of the grid, since every scalar write to a NumPy array is far slower.
+        side = maze.size * 2 + 1
+        cells = bytearray(maze.grid.tobytes())
+        stack = []
+
+        # Set initial values for the maze instance
+        start_x, start_y = 0, 0
+        cells[(start_y * 2 + 1) * side + start_x * 2 + 1] = 0
+        visited[start_y * maze.size + start_x] = True
+        stack.append((start_x, start_y))
+
+        # While the maze stack has contents, get the neighbors of the top cell in the stack and carve paths.
+        while stack:
+            x, y = stack[-1]
+            neighbors = self.get_neighbors(maze, visited, x, y)
+            if neighbors:
+                nx, ny = maze.rng.choice(neighbors)
+                carve_path(cells, side, x, y, nx, ny)
+                visited[ny * maze.size + nx] = True
+                stack.append((nx, ny))
+            else:
+                stack.pop()
+        maze.grid = np.frombuffer(cells, dtype=np.uint8).reshape(side, side)
+
+
+# Randomized Kruskal's algorithm - joins cells across walls taken in random order, lots of short dead ends
+class KruskalGenerator(MazeGenerator):
+    name = "kruskal"
+
+    # Function to carve the maze
+    def carve(self, maze):
+        size = maze.size
+        side = size * 2 + 1
+        # Every cell is a path from the start; only the walls between cells are decided below.
+        maze.grid[1::2, 1::2] = 0
+
+        # Walls are numbered with the size * (size - 1) walls between horizontal neighbors first, then the ones between
+        # vertical neighbors. Shuffle those numbers with a NumPy generator seeded from the maze RNG so the result stays
+        # reproducible.
+        horizontal = size * (size - 1)
+        order = np.random.default_rng(maze.rng.getrandbits(64)).permutation(horizontal * 2)
+
+        # Open every wall whose two cells are not connected yet. The two cells and the grid index of each wall are
+        # worked out from its number a chunk at a time, so only one chunk is ever held as Python ints.
+        sets = UnionFind(size * size)
+        flat = maze.grid.reshape(-1)
+        for offset in range(0, len(order), KRUSKAL_CHUNK):
+            chunk = order[offset:offset + KRUSKAL_CHUNK]
+            isVertical = chunk >= horizontal
+            y, x = np.divmod(chunk - horizontal * isVertical, np.where(isVertical, size, size - 1))
+            first = y * size + x
+            second = first + np.where(isVertical, size, 1)
+            walls = (y * 2 + 1 + isVertical) * side + x * 2 + 2 - isVertical
+            opened = [sets.union(a, b) for a, b in zip(first.tolist(), second.tolist())]
+            flat[walls[np.array(opened, dtype=bool)]] = 0
+
+
+# Wilson's algorithm - loop-erased random walks, an unbiased sample of all possible mazes
+class WilsonGenerator(MazeGenerator):
+    name = "wilson"
+
+    # Function to carve the maze
+    def carve(self, maze):
+        size = maze.size
+        side = size * 2 + 1
+        rng = maze.rng
+        inMaze = bytearray(size * size)
+        # Paths are carved into a flat copy of the grid, as in DepthFirstGenerator.
+        cells = bytearray(maze.grid.tobytes())
+        # Direction the walk last left each cell in. Overwriting it on revisits is what erases the loops.
+        exitDir = bytearray(size * size)
+
+        # Seed the maze with one random cell.
+        first = rng.randrange(size * size)
+        inMaze[first] = 1
+        cells[((first // size) * 2 + 1) * side + (first % size) * 2 + 1] = 0
+
+        for start in range(size * size):
+            if inMaze[start]:
+                continue
+
+            # Random walk from start until it hits the maze, remembering the last exit from every cell.
+            cell = start
+            while not inMaze[cell]:
+                x, y = cell % size, cell // size
+                while True:
+                    direction = rng.randrange(4)
+                    dx, dy = DIRECTIONS[direction]
+                    if 0 <= x + dx < size and 0 <= y + dy < size:
+                        break
+                exitDir[cell] = direction
+                cell = (y + dy) * size + (x + dx)
+
+            # Retrace the loop-erased path and add it to the maze.
+            cell = start
+            while not inMaze[cell]:
+                x, y = cell % size, cell // size
+                dx, dy = DIRECTIONS[exitDir[cell]]
+                inMaze[cell] = 1
+                cells[(y * 2 + 1) * side + x * 2 + 1] = 0
+                carve_path(cells, side, x, y, x + dx, y + dy)
+                cell = (y + dy) * size + (x + dx)
+        maze.grid = np.frombuffer(cells, dtype=np.uint8).reshape(side, side)
+
+
+# Eller's algorithm - builds the maze one row at a time with only O(width) working memory
+class EllerGenerator(MazeGenerator):
+    name = "eller"
+
+    # Function to carve the maze
+    def carve(self, maze):
+        size = maze.size
+        rng = maze.rng
+        grid = maze.grid
+        # Set label of each cell in the current row, or -1 for a cell that isn't in a set yet.
+        # Labels are renumbered every row, so they always stay below 2 * size.
+        labels = [-1] * size
+
+        for y in range(size):
+            gy = y * 2 + 1
+            lastRow = y == size - 1
+            grid[gy, 1::2] = 0
+
+            # Give every cell that wasn't joined from above a set of its own.
+            used = set(labels)
+            fresh = (label for label in range(2 * size) if label not in used)
+            labels = [label if label >= 0 else next(fresh) for label in labels]
+            sets = UnionFind(2 * size)
+
+            # Randomly join horizontally adjacent cells from different sets. The last row joins all of them.
+            for x in range(size - 1):
+                if sets.find(labels[x]) != sets.find(labels[x + 1]) and (
+                    lastRow or rng.random() < 0.5
+                ):
+                    sets.union(labels[x], labels[x + 1])
+                    grid[gy, x * 2 + 2] = 0
+            if lastRow:
+                break
+
+            # Every set carves down at least once so no part of the maze is cut off.
+            members = {}
+            for x in range(size):
+                members.setdefault(sets.find(labels[x]), []).append(x)
+            nextLabels = [-1] * size
+            for root, xs in members.items():
+                down = [x for x in xs if rng.random() < 0.5] or [rng.choice(xs)]
+                for x in down:
+                    grid[gy + 1, x * 2 + 1] = 0
+                    nextLabels[x] = root
+            labels = nextLabels
+
+
+# Version of the generators' output - bump it whenever a change alters the maze any (algorithm, size, seed) yields,
+# so mazes cached by an older generator are not served in place of the new ones
+GENERATOR_VERSION = 2
+
+# Generators available to Maze, by name
+GENERATORS = {
+    generator.name: generator
+    for generator in (DepthFirstGenerator, KruskalGenerator, WilsonGenerator, EllerGenerator)
+}
+
+
+# Class to handle functions relating to the maze
+class Maze:
+    # Initialization fuction
+    def __init__(self, size, seed=None, rng=None, algorithm="dfs"):
+        # Sets variables for the maze
+        # All randomness comes from self.rng, so a maze is fully reproducible from its seed.
+        # Without an explicit seed or RNG a fresh seed is drawn and recorded, so any maze can be regenerated later.
+        # The grid is a compact uint8 array (1 is wall, 0 is path) so large mazes don't hold a boxed int per cell.
+        self.size = size
+        self.grid = np.ones((size * 2 + 1, size * 2 + 1), dtype=np.uint8)
+        self.end = []
+        # Flat BFS distance field from the start cell, filled in by generate()
+        self.distances = None
+        if rng is None:
+            if seed is None:
+                seed = random.getrandbits(32)
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unknown maze algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.generator = GENERATORS[algorithm]()
+
+    # Helper function - returns False if coordinate is outside maze boundaries.
+    def in_bounds(self, x, y):
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    # Function to count the walls surrounding every interior grid cell
+    def wall_neighbors(self):
+        """Counts the walls directly above, below, left and right of every interior grid cell.
+
+        Returns:
+            numpy.ndarray: Array of shape (2 * size - 1, 2 * size - 1) where entry [y - 1, x - 1] is the
+            number of wall neighbors of grid cell (x, y).
+        """
+        grid = self.grid
+        return (
+            grid[:-2, 1:-1]
+            + grid[2:, 1:-1]
+            + grid[1:-1, :-2]
+            + grid[1:-1, 2:]
+        )
+
+    # Function to locate dead ends within the maze.
+    def find_dead_ends(self):
+        """A function to find dead ends within the maze by checking that only one neighbor for a checked cell is marked as a path.
+
+        Returns:
+            list: A list containing the x,y tuples of all the dead ends within the maze.
+        """
+        # Only the odd grid coordinates are maze cells, so slice them out of the interior neighbor counts.
+        cells = self.grid[1:-1:2, 1:-1:2]
+        neighbors = self.wall_neighbors()[::2, ::2]
+        # If three of the four neighbors are walls, the cell is a dead end. nonzero() keeps row-major scan order.
+        ys, xs = np.nonzero((cells == 0) & (neighbors == 3))
+        return [(int(x) * 2 + 1, int(y) * 2 + 1) for y, x in zip(ys, xs)]
+
+    # Function to look up how far a grid cell is from the start along the paths of the maze
+    def distance(self, x, y):
+        """Returns the path length from the start cell (1, 1) to grid cell (x, y) in O(1).
+
+        Args:
+            x (int): X-value of the grid cell
+            y (int): Y-value of the grid cell
+
+        Returns:
+            int: Number of steps from the start, or -1 if the cell is a wall or can't be reached
+        """
+        if self.distances is None:
+            self.distances = distance_field(self.grid)
+        return int(self.distances[y * (self.size * 2 + 1) + x])
+
+    # Function to open extra walls so the maze has loops
+    def braid(self, total):
+        """Opens up to total walls that have fewer than three wall neighbors, picked at random without replacement.
+
+        The eligible walls are collected up front and drawn from a pool, and neighbor counts are updated as walls
+        open so that walls which become eligible join the pool. Each wall enters and leaves the pool at most once, so
+        the pass takes O(walls) time however dense the grid is.
+
+        Args:
+            total (int): Number of walls to open
+
+        Returns:
+            int: Number of walls that were opened, which is less than total if the eligible walls ran out
+        """
+        side = self.size * 2 + 1
+        # Only walls with coordinates 1..2 * size - 2 are considered, as before.
+        region = np.zeros((side, side), dtype=np.uint8)
+        region[1:-2, 1:-2] = 1
+        counts = np.zeros((side, side), dtype=np.int16)
+        counts[1:-1, 1:-1] = self.wall_neighbors()
+        eligible = np.flatnonzero((region == 1) & (self.grid == 1) & (counts < 3))
+
+        # Flat copies for the per-wall bookkeeping, where scalar access on plain arrays is much cheaper than NumPy.
+        cells = bytearray(self.grid.tobytes())
+        region = bytes(region.tobytes())
+        counts = array("h", counts.tobytes())
+        pool = eligible.tolist()
+        rng = self.rng
+        opened = []
+        while len(opened) < total and pool:
+            # Swap a random wall to the back of the pool and take it.
+            i = rng.randrange(len(pool))
+            pool[i], pool[-1] = pool[-1], pool[i]
+            wall = pool.pop()
+            cells[wall] = 0
+            opened.append(wall)
+            # The opened wall is no longer a wall neighbor of the four cells around it. Counts only go down, so a
+            # wall dropping from three to two wall neighbors is becoming eligible for the first time.
+            for neighbor in (wall - side, wall + side, wall - 1, wall + 1):
+                counts[neighbor] -= 1
+                if counts[neighbor] == 2 and cells[neighbor] and region[neighbor]:
+                    pool.append(neighbor)
+
+        np.put(self.grid, opened, 0)
+        return len(opened)
+
+    # Function to handle all of the maze generation
+    def generate(self):
+        # Carve a perfect maze with the selected algorithm
+        self.generator.carve(self)
+
+        # Choose a couple of random walls in the maze and make them paths.
+        totalWalls = int(self.grid.sum(dtype=np.int64))
+        # Chooses a number that is between 6% and 12% of all of the walls - This ensures a variety in the openness of the maze
+        total = self.rng.randint(int(0.06 * totalWalls), int(0.12 * totalWalls))
+        self.braid(total)
+
+        # Measure every path cell's distance from the start once, for exit placement and later queries.
+        self.distances = distance_field(self.grid)
+
+        # Enumerate all dead ends in the maze and chose some as the end points of the maze.
+        # They are ordered by path distance from the start, so each exit is placed in a band of real path length.
+        # If there are no dead ends somehow, default to the bottom-right corner of the maze.
+        dead_ends = sorted(self.find_dead_ends(), key=lambda cell: self.distance(*cell))
+        if dead_ends:
+            # First exit - From 1/3 to 1/2 of the way out
+            self.end.append(
+                dead_ends[
+                    self.rng.randint(-((len(dead_ends) * 2) // 3), -(len(dead_ends) // 2))
+                ]
+            )
+            # Second exit - From 1/2 to 2/3 of the way out
+            self.end.append(
+                dead_ends[
+                    self.rng.randint(-(len(dead_ends) // 2), -(len(dead_ends) // 3))
+                ]
+            )
+            # Third exit - From 2/3 of the way out to the farthest dead end.
+            self.end.append(dead_ends[self.rng.randint(-(len(dead_ends) // 3), -1)])
+        else:
+            self.end.append((self.size * 2 - 1, self.size * 2 - 1))
+
+        return self.grid, self.end
+
+
+# Class to handle an endless maze that is generated lazily in fixed-size chunks
+class ChunkedMaze:
+    """An unbounded maze built from square chunks that are generated on demand.
+
+    Chunk (cx, cy) covers grid x in [cx * 2 * chunk_size, (cx + 1) * 2 * chunk_size) and the matching y range, with
+    the same (x, y) -> grid[y][x] layout as Maze. Each chunk owns its top and left border walls; the openings in a
+    border are drawn from a seed for that border alone, so the chunks on both sides of it always agree. Every chunk is
+    generated from the maze seed and its coordinates, so a chunk evicted from the LRU cache comes back identical.
+    """
+
+    # Initialization function
+    def __init__(self, seed, chunk_size=16, algorithm="dfs", cache_size=64):
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        # (cx, cy) -> (grid, exits), least recently used first
+        self.chunks = OrderedDict()
+
+    # Helper function - returns a random number generator for one part of the maze
+    def rng_for(self, kind, cx, cy):
+        # String seeds are hashed with SHA-512 by random.Random, so they are stable across runs and processes.
+        return random.Random(f"{self.seed}:{self.algorithm}:{kind}:{cx}:{cy}")
+
+    # Helper function - returns the grid offsets of the openings in one chunk border
+    def border_openings(self, kind, cx, cy):
+        rng = self.rng_for(kind, cx, cy)
+        count = 1 + rng.randrange(max(1, self.chunk_size // 4))
+        return [i * 2 + 1 for i in rng.sample(range(self.chunk_size), count)]
+
+    # Function to generate a single chunk
+    def build_chunk(self, cx, cy):
+        size = self.chunk_size
+        maze = Maze(size, seed=f"{cx}:{cy}", rng=self.rng_for("chunk", cx, cy), algorithm=self.algorithm)
+        maze.generator.carve(maze)
+        totalWalls = int(maze.grid.sum(dtype=np.int64))
+        maze.braid(maze.rng.randint(int(0.06 * totalWalls), int(0.12 * totalWalls)))
+
+        # Keep the top and left borders; the bottom and right ones belong to the neighboring chunks.
+        grid = maze.grid[:-1, :-1].copy()
+        grid[0, self.border_openings("top", cx, cy)] = 0
+        grid[self.border_openings("left", cx, cy), 0] = 0
+
+        # One exit per chunk, on a dead end away from the chunk borders.
+        exits = []
+        deadEnds = [
+            (x, y)
+            for x, y in maze.find_dead_ends()
+            if 1 < x < size * 2 - 1 and 1 < y < size * 2 - 1
+        ]
+        if deadEnds:
+            x, y = maze.rng.choice(deadEnds)
+            exits.append((cx * size * 2 + x, cy * size * 2 + y))
+        return grid, exits
+
+    # Function to fetch a chunk, generating it if it isn't cached
+    def chunk(self, cx, cy):
+        key = (cx, cy)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+        built = self.build_chunk(cx, cy)
+        self.chunks[key] = built
+        # Evict the chunks that were used longest ago - they will be regenerated identically if needed again.
+        while len(self.chunks) > self.cache_size:
+            self.chunks.popitem(last=False)
+        return built
+
+    # Function to look up a single grid cell
+    def cell(self, x, y):
+        span = self.chunk_size * 2
+        grid, _ = self.chunk(x // span, y // span)
+        return int(grid[y % span, x % span])
+
+    # Function to copy out a rectangular part of the maze
+    def window(self, x0, y0, width, height):
+        """Assembles the part of the maze with its top-left corner at grid cell (x0, y0).
+
+        Args:
+            x0 (int): X-value of the top-left grid cell
+            y0 (int): Y-value of the top-left grid cell
+            width (int): Number of grid columns
+            height (int): Number of grid rows
+
+        Returns:
+            tuple: The (grid, end) of the window, in the same format Maze.generate() returns, with the exits given in
+            window coordinates.
+        """
+        span = self.chunk_size * 2
+        grid = np.empty((height, width), dtype=np.uint8)
+        end = []
+        for cy in range(y0 // span, (y0 + height - 1) // span + 1):
+            for cx in range(x0 // span, (x0 + width - 1) // span + 1):
+                chunkGrid, exits = self.chunk(cx, cy)
+                # Overlap of this chunk with the window, in grid coordinates
+                left, right = max(x0, cx * span), min(x0 + width, (cx + 1) * span)
+                top, bottom = max(y0, cy * span), min(y0 + height, (cy + 1) * span)
+                grid[top - y0 : bottom - y0, left - x0 : right - x0] = chunkGrid[
+                    top - cy * span : bottom - cy * span, left - cx * span : right - cx * span
+                ]
+                end.extend(
+                    (x - x0, y - y0)
+                    for x, y in exits
+                    if left <= x < right and top <= y < bottom
+                )
+        return grid, end
@@ -0,0 +1,107 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from .maze import GENERATOR_VERSION
+
+"""
+On-disk cache of generated mazes.
+
+Each maze is stored in its own file named after its (algorithm, size, seed) key and the generator version, so a
+change to how mazes are generated never serves a stale one. The file holds a small header, the exits as pairs of
+uint32 coordinates and then the wall grid packed to one bit per cell, so a 1000x1000 maze takes ~500 KB instead of
+~4 MB. Files are read back through a memory map, which lets curated or tournament levels be
+served without running the generator at all.
+"""
+
+# File layout - magic, grid side length, number of exits
+MAGIC = b"MMZ1"
+HEADER = struct.Struct("<4sII")
+EXIT = struct.Struct("<II")
+
+
+# Class to handle reading and writing cached mazes
+class MazeCache:
+    # Initialization function
+    def __init__(self, directory):
+        self.directory = directory
+
+    # Helper function - returns the file that holds the maze for a key
+    def path(self, size, seed, algorithm):
+        return os.path.join(self.directory, f"{algorithm}-{size}-{seed}-v{GENERATOR_VERSION}.mmz")
+
+    # Function to read a maze back from the cache
+    def load(self, size, seed, algorithm):
+        """Loads a cached maze through a memory map.
+
+        Args:
+            size (int): Size of the maze in cells
+            seed (int): Seed the maze was generated from
+            algorithm (str): Name of the generation algorithm
+
+        Returns:
+            tuple: The (grid, end) of the maze, or None if it is not cached or the file is unreadable.
+        """
+        try:
+            with open(self.path(size, seed, algorithm), "rb") as mazeFile:
+                with mmap.mmap(mazeFile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    magic, side, numExits = HEADER.unpack_from(data, 0)
+                    if magic != MAGIC or side != size * 2 + 1:
+                        return None
+                    offset = HEADER.size
+                    end = []
+                    for _ in range(numExits):
+                        end.append(EXIT.unpack_from(data, offset))
+                        offset += EXIT.size
+                    packed = np.frombuffer(data, dtype=np.uint8, offset=offset)
+                    # unpackbits copies into a fresh array, so the map can be closed once the view is released.
+                    grid = np.unpackbits(packed, count=side * side).reshape(side, side)
+                    del packed
+        except (OSError, ValueError, struct.error):
+            return None
+        return grid, end
+
+    # Function to write a maze into the cache
+    def store(self, size, seed, algorithm, grid, end):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(size, seed, algorithm)
+        tmpPath = f"{path}.{os.getpid()}.tmp"
+        with open(tmpPath, "wb") as mazeFile:
+            mazeFile.write(HEADER.pack(MAGIC, len(grid), len(end)))
+            for x, y in end:
+                mazeFile.write(EXIT.pack(x, y))
+            mazeFile.write(np.packbits(np.asarray(grid, dtype=np.uint8)).tobytes())
+        # Write to a temporary file first so a half-written maze is never picked up by load().
+        os.replace(tmpPath, path)
+
+    # Function to serve a maze from the cache, generating and storing it on a miss
+    def get(self, size, seed, algorithm, generate):
+        """Returns the cached maze for a key, calling generate() and caching its result on a miss.
+
+        Args:
+            size (int): Size of the maze in cells
+            seed (int): Seed the maze is generated from
+            algorithm (str): Name of the generation algorithm
+            generate (callable): Function that returns a freshly generated (grid, end)
+
+        Returns:
+            tuple: The (grid, end) of the maze
+        """
+        cached = self.load(size, seed, algorithm)
+        if cached is not None:
+            return cached
+        grid, end = generate()
+        try:
+            self.store(size, seed, algorithm, grid, end)
+        except OSError:
+            # A read-only or full disk only costs us the cache, not the maze.
+            pass
+        return grid, end
@@ -0,0 +1,167 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import csv
+import json
+from collections import deque
+from time import perf_counter
+
+"""
+Frame phase profiler.
+
+Code that makes up a frame is wrapped in named phases:
+
+    with PROFILER.phase("walls"):
+        ...
+
+Time spent in a phase is summed over the frame, and end_frame() moves the totals into a rolling window per phase
+(for the dev-mode overlay) and into the running totals of the current level. end_level() turns those into a summary
+with percentiles, and dump() writes every level summary so far to a JSON or CSV file.
+"""
+
+
+# Helper function - nearest-rank percentile of a sorted list
+def percentile(ordered, p):
+    return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+
+# Helper function - summarizes a list of samples in seconds
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "median": percentile(ordered, 50),
+        "p90": percentile(ordered, 90),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+# Class to time one named phase, reused every time the phase runs
+class PhaseTimer:
+    __slots__ = ("profiler", "name", "started")
+
+    # Initialization function
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.started = 0.0
+
+    # Function to start timing the phase
+    def start(self):
+        self.started = perf_counter()
+
+    # Function to stop timing the phase and add the time to the current frame
+    def stop(self):
+        self.profiler.add(self.name, perf_counter() - self.started)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+# Class to collect per-phase frame timings
+class FrameProfiler:
+    # Initialization function
+    def __init__(self, window=600):
+        """Creates a profiler that keeps the last window frames for rolling percentiles.
+
+        Args:
+            window (int): Number of recent frames to keep per phase
+        """
+        self.window = window
+        self.timers = {}
+        # Phase -> seconds spent in it during the frame in progress
+        self.current = {}
+        # Phase -> the last window frame totals
+        self.recent = {}
+        # Phase -> every frame total since the current level started
+        self.level = {}
+        self.levels = []
+        self.frames = 0
+        self.frame_started = perf_counter()
+
+    # Function to get the timer for a phase
+    def phase(self, name):
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = PhaseTimer(self, name)
+        return timer
+
+    # Function to add time to a phase of the current frame
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    # Function to mark the start of a frame
+    def start_frame(self):
+        self.frame_started = perf_counter()
+
+    # Function to close the current frame and record its totals
+    def end_frame(self):
+        # Phases that didn't run this frame are left out, so they don't drag their percentiles down to zero.
+        self.current["frame"] = perf_counter() - self.frame_started
+        for name, seconds in self.current.items():
+            recent = self.recent.get(name)
+            if recent is None:
+                recent = self.recent[name] = deque(maxlen=self.window)
+                self.level[name] = []
+            recent.append(seconds)
+            self.level.setdefault(name, []).append(seconds)
+        self.current = {}
+        self.frames += 1
+
+    # Function to get rolling statistics for every phase
+    def stats(self):
+        """Summarizes the last window frames of every phase.
+
+        Returns:
+            dict: Phase name -> summary as returned by summarize(), in seconds
+        """
+        return {name: summarize(samples) for name, samples in self.recent.items() if samples}
+
+    # Function to close the current level and keep its summary
+    def end_level(self, level):
+        """Summarizes every frame since the last call and starts collecting for the next level.
+
+        Args:
+            level (int): Level the frames belong to
+
+        Returns:
+            dict: The level summary, or None if no frames were recorded
+        """
+        phases = {name: summarize(samples) for name, samples in self.level.items() if samples}
+        self.level = {}
+        if not phases:
+            return None
+        summary = {"level": level, "frames": phases["frame"]["count"], "phases": phases}
+        self.levels.append(summary)
+        return summary
+
+    # Function to write the level summaries to a file
+    def dump(self, path):
+        """Writes every level summary so far to path - as CSV if it ends in .csv, otherwise as JSON.
+
+        Args:
+            path (str): File to write
+        """
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="") as outputFile:
+                writer = csv.writer(outputFile)
+                writer.writerow(["level", "phase", "count", "mean_ms", "median_ms", "p90_ms", "p99_ms", "max_ms"])
+                for summary in self.levels:
+                    for name, stats in summary["phases"].items():
+                        writer.writerow(
+                            [summary["level"], name, stats["count"]]
+                            + [f"{stats[key] * 1000:.4f}" for key in ("mean", "median", "p90", "p99", "max")]
+                        )
+        else:
+            with open(path, "w") as outputFile:
+                json.dump({"levels": self.levels}, outputFile, indent=2)
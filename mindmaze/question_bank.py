@@ -0,0 +1,710 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import argparse
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+from collections import namedtuple
+
+"""
+Question bank.
+
+Question files hold 5 lines per question - the question, the correct answer and three wrong answers - and every file
+is one difficulty tier, easiest first. The bank parses every file once at startup. Each tier is a deck of its
+questions in random order, and drawing a question takes the top of the current tier's deck, so a draw is O(1) and
+never touches the disk. The decks are shuffled lazily, one card per draw, so even a huge tier costs nothing until
+its questions are drawn.
+
+Big banks can be compiled into a single binary file that is memory-mapped instead of parsed:
+
+    python -m mindmaze.question_bank compile -o questions.mmq Q_A_easy.txt Q_A_medium.txt Q_A_hard.txt
+
+The file starts with a header and the number of questions in each tier. A fixed-width index of uint32 offsets follows,
+5 per question plus one closing offset, into a blob of UTF-8 text holding every field back to back. Opening the file
+only reads the header, and a question's text is decoded when it is drawn.
+
+The game keeps one compiled bank per question file, named after the SHA-1 of the file's contents, next to a JSON
+index that records each file's hash, size, modification time and lint problems. At startup a file whose size and
+modification time match the index is trusted without being read, and only files whose contents actually changed are
+linted and compiled again. Compiled banks the index no longer refers to are deleted. The same checks can be run by
+hand, with line numbers for every problem:
+
+    python -m mindmaze.question_bank lint Q_A_easy.txt Q_A_medium.txt Q_A_hard.txt
+"""
+
+# Number of lines that make up one question in a question file
+LINES_PER_QUESTION = 5
+
+# One question - tier is the index of the file it came from and index its position within that file
+Question = namedtuple("Question", ["tier", "index", "text", "correct", "wrong"])
+
+# Compiled bank layout - magic, number of tiers, number of questions
+MAGIC = b"MMQ2"
+HEADER = struct.Struct("<4sII")
+OFFSET = struct.Struct("<I")
+RECORD = struct.Struct(f"<{LINES_PER_QUESTION + 1}I")
+
+# Question files the tools work on when none are given
+DEFAULT_FILES = ["Q_A_easy.txt", "Q_A_medium.txt", "Q_A_hard.txt"]
+# Version of the index format - an index with any other version is rebuilt
+INDEX_VERSION = 3
+
+
+# Class to describe a problem found in a question file
+class Problem(namedtuple("Problem", ["path", "line", "severity", "message"])):
+    def __str__(self):
+        return f"{self.path}:{self.line}: {self.severity}: {self.message}"
+
+
+# Function to read the questions from a question file
+def parse_file(path, tier=0):
+    """Reads a question file into Question records, leaving out any question with errors (see check_lines).
+
+    Args:
+        path (str): The question file
+        tier (int): Difficulty tier to record on the questions
+
+    Returns:
+        list: The questions in file order
+    """
+    with open(path, "rb") as questionFile:
+        lines, _ = decode_lines(path, questionFile.read())
+    return check_lines(path, lines, tier)[0]
+
+
+# Helper function - splits the raw contents of a question file into lines, reporting bytes that aren't UTF-8
+def decode_lines(path, data):
+    problems = []
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as error:
+        line = data[: error.start].count(b"\n") + 1
+        problems.append(Problem(path, line, "error", "text is not valid UTF-8"))
+        text = data.decode("utf-8", errors="replace")
+    lines = text.replace("\r\n", "\n").split("\n")
+    # A newline at the end of the file doesn't start another line
+    if lines[-1] == "":
+        lines.pop()
+    return lines, problems
+
+
+# Helper function - checks whether a line of a question file starts a question
+def is_question(line):
+    return line.strip().lower().startswith("q.")
+
+
+# Function to check the lines of a question file and read its questions
+def check_lines(path, lines, tier=0):
+    """Reads the questions in the lines of a question file and reports every problem with its line number.
+
+    Questions would be found by position alone, so one missing or extra line shifts every question after it. Instead
+    every question starts at a line starting with "q.", and the next such line ends it, so a slip only affects the
+    question it happens in. Questions with errors are reported and left out rather than read with the wrong answers.
+
+    Args:
+        path (str): Name of the file, used in the problems
+        lines (list): The lines of the file
+        tier (int): Difficulty tier to record on the questions
+
+    Returns:
+        tuple: The questions without errors in file order, and the problems found in line order
+    """
+    questions = []
+    problems = []
+    seen = {}
+    start = 0
+    while start < len(lines):
+        first = start + 1
+        if not is_question(lines[start]):
+            # Skip to the next question and report the lines that don't belong to one
+            end = start + 1
+            while end < len(lines) and not is_question(lines[end]):
+                end += 1
+            message = f"{end - start} line(s) here don't belong to a question starting with 'q.'"
+            problems.append(Problem(path, first, "error", message))
+            start = end
+            continue
+
+        # The question runs up to the next line starting with "q.", which must be exactly LINES_PER_QUESTION lines on
+        end = start + 1
+        while end < len(lines) and not is_question(lines[end]):
+            end += 1
+        found = []
+        record = [line.strip() for line in lines[start:end]]
+        if len(record) < LINES_PER_QUESTION:
+            found.append(
+                Problem(path, first, "error", f"question has {len(record) - 1} of {LINES_PER_QUESTION - 1} answers")
+            )
+        elif len(record) > LINES_PER_QUESTION:
+            # An extra line would otherwise be read as the correct answer and shift the others along
+            extra = len(record) - LINES_PER_QUESTION
+            found.append(Problem(path, first, "error", f"question has {extra} extra line(s) among its answers"))
+            record = record[:LINES_PER_QUESTION]
+        for offset, text in enumerate(record):
+            if not text:
+                found.append(Problem(path, first + offset, "error", "empty line"))
+
+        question, answers = record[0], record[1:]
+        # Answers that read the same make the question ambiguous, or give the right one away
+        if answers and answers[0] and answers[0].lower() in (answer.lower() for answer in answers[1:]):
+            found.append(Problem(path, first + 1, "error", "the correct answer is also listed as a wrong answer"))
+        wrong = [answer.lower() for answer in answers[1:] if answer]
+        if len(set(wrong)) < len(wrong):
+            found.append(Problem(path, first + 2, "warning", "two wrong answers are the same"))
+        key = question.lower()
+        if key in seen:
+            found.append(Problem(path, first, "warning", f"same question as line {seen[key]}"))
+        else:
+            seen[key] = first
+
+        if not any(problem.severity == "error" for problem in found):
+            questions.append(Question(tier, len(questions), question, answers[0], tuple(answers[1:])))
+        problems.extend(found)
+        start = end
+    return questions, problems
+
+
+# Function to check a question file for mistakes
+def lint_file(path):
+    with open(path, "rb") as questionFile:
+        lines, problems = decode_lines(path, questionFile.read())
+    return sorted(problems + check_lines(path, lines)[1], key=lambda problem: problem.line)
+
+
+# Function to compile question files into a memory-mappable bank
+def compile_bank(paths, output):
+    """Parses question files and writes them to output in the compiled format.
+
+    Args:
+        paths (list): The question files, easiest tier first
+        output (str): The file to write
+
+    Returns:
+        int: The number of questions written
+    """
+    tiers = [parse_file(path, tier) for tier, path in enumerate(paths)]
+    write_bank(tiers, output)
+    return sum(len(questions) for questions in tiers)
+
+
+# Function to write questions in the compiled format
+def write_bank(tiers, output):
+    """Writes questions to output in the compiled format.
+
+    Args:
+        tiers (list): A list of questions for every tier
+        output (str): The file to write
+    """
+    # Lay every field out back to back and note where each one starts
+    blob = bytearray()
+    offsets = []
+    for questions in tiers:
+        for question in questions:
+            for field in (question.text, question.correct) + question.wrong:
+                offsets.append(len(blob))
+                blob += field.encode("utf-8")
+    offsets.append(len(blob))
+
+    numQuestions = sum(len(questions) for questions in tiers)
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmpPath = f"{output}.{os.getpid()}.tmp"
+    with open(tmpPath, "wb") as bankFile:
+        bankFile.write(HEADER.pack(MAGIC, len(tiers), numQuestions))
+        bankFile.write(struct.pack(f"<{len(tiers)}I", *(len(questions) for questions in tiers)))
+        bankFile.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        bankFile.write(blob)
+    # Write to a temporary file first so a half-written bank is never opened by the game.
+    os.replace(tmpPath, output)
+
+
+# Class to read the questions of one tier out of a compiled bank on demand
+class CompiledTier:
+    # Initialization function
+    def __init__(self, bank, tier, first, count):
+        self.bank = bank
+        self.tier = tier
+        self.first = first
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.bank.question(self.tier, index, self.first + index)
+
+
+# Class to handle a memory-mapped compiled bank
+class CompiledBank:
+    # Initialization function
+    def __init__(self, path, first_tier=0):
+        """Opens a compiled bank. Only the header is read - questions are decoded as they are asked for.
+
+        Args:
+            path (str): The compiled bank file
+            first_tier (int): Tier number to give the bank's first tier, for banks that hold part of a bigger bank
+
+        Raises:
+            ValueError: If the file isn't a compiled question bank
+        """
+        with open(path, "rb") as bankFile:
+            self.data = mmap.mmap(bankFile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, numTiers, numQuestions = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.data.close()
+            raise ValueError(f"{path} is not a compiled question bank")
+        offset = HEADER.size
+        counts = struct.unpack_from(f"<{numTiers}I", self.data, offset)
+        self.index = offset + numTiers * OFFSET.size
+        self.blob = self.index + (numQuestions * LINES_PER_QUESTION + 1) * OFFSET.size
+        self.tiers = []
+        first = 0
+        for tier, count in enumerate(counts):
+            self.tiers.append(CompiledTier(self, first_tier + tier, first, count))
+            first += count
+
+    # Function to decode one question
+    def question(self, tier, index, position):
+        offsets = RECORD.unpack_from(self.data, self.index + position * LINES_PER_QUESTION * OFFSET.size)
+        fields = [
+            self.data[self.blob + start : self.blob + end].decode("utf-8")
+            for start, end in zip(offsets, offsets[1:])
+        ]
+        return Question(tier, index, fields[0], fields[1], tuple(fields[2:]))
+
+    # Function to release the memory map
+    def close(self):
+        self.data.close()
+
+
+# Helper function - returns where the compiled bank for a question file with the given hash is kept
+def segment_path(index, digest):
+    return os.path.join(os.path.dirname(index), f"{digest}.mmq")
+
+
+# Function to bring the index of question files up to date
+def update_index(paths, index):
+    """Makes sure every question file has a current entry in the index and a compiled bank, and returns the entries.
+
+    Files whose size and modification time match their entry are trusted without being read. Any other file is
+    hashed, and it is only linted and compiled again if its contents changed. Questions with errors are left out of
+    the compiled bank.
+
+    Args:
+        paths (list): The question files
+        index (str): The index file - compiled banks are kept in the same folder
+
+    Returns:
+        list: The index entry of every file, in the same order as paths
+    """
+    try:
+        with open(index, "r") as indexFile:
+            data = json.load(indexFile)
+        entries = data["files"] if data.get("version") == INDEX_VERSION else {}
+    except (OSError, ValueError, KeyError, AttributeError):
+        entries = {}
+
+    changed = False
+    for path in paths:
+        info = os.stat(path)
+        entry = entries.get(path)
+        if (
+            entry is not None
+            and entry["size"] == info.st_size
+            and entry["mtime_ns"] == info.st_mtime_ns
+            and os.path.exists(segment_path(index, entry["sha1"]))
+        ):
+            continue
+
+        with open(path, "rb") as questionFile:
+            raw = questionFile.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if entry is None or entry["sha1"] != digest or not os.path.exists(segment_path(index, digest)):
+            lines, problems = decode_lines(path, raw)
+            questions, found = check_lines(path, lines)
+            problems = sorted(problems + found, key=lambda problem: problem.line)
+            write_bank([questions], segment_path(index, digest))
+            entry = {
+                "sha1": digest,
+                "questions": len(questions),
+                "problems": [[problem.line, problem.severity, problem.message] for problem in problems],
+            }
+        # A file that was touched but not changed only needs its new size and time recorded
+        entry["size"] = info.st_size
+        entry["mtime_ns"] = info.st_mtime_ns
+        entries[path] = entry
+        changed = True
+
+    if changed:
+        tmpPath = f"{index}.{os.getpid()}.tmp"
+        with open(tmpPath, "w") as indexFile:
+            json.dump({"version": INDEX_VERSION, "files": entries}, indexFile, indent=2)
+        os.replace(tmpPath, index)
+        prune_segments(index, entries)
+    return [entries[path] for path in paths]
+
+
+# Helper function - checks whether a file name is one segment_path() gives, a sha1 hex digest with the .mmq extension
+def is_segment_name(name):
+    stem, extension = os.path.splitext(name)
+    return extension == ".mmq" and len(stem) == 40 and all(char in "0123456789abcdef" for char in stem)
+
+
+# Helper function - deletes the compiled banks of old versions of question files, which no index entry refers to
+def prune_segments(index, entries):
+    directory = os.path.dirname(index) or "."
+    used = {f"{entry['sha1']}.mmq" for entry in entries.values()}
+    for name in os.listdir(directory):
+        # Only segments are removed - a bank compiled by hand into the same folder is left alone
+        if is_segment_name(name) and name not in used:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+# Class to hold every question and hand them out without repeats
+class QuestionBank:
+    # Initialization function
+    def __init__(self, tiers, rng=random):
+        """Creates a bank from questions that are already loaded.
+
+        Args:
+            tiers (list): A sequence of questions for every difficulty tier, easiest first - anything with len() and
+                indexing works, so a compiled bank's questions are only decoded when they are drawn
+            rng (random.Random): Source of randomness for shuffling the decks - the random module by default, so
+                random.seed() makes the order reproducible
+        """
+        self.tiers = list(tiers)
+        self.rng = rng
+        # Problems found in the question files when they were loaded through an index
+        self.problems = []
+        self.total = sum(len(questions) for questions in self.tiers)
+        # Decks are shuffled as they are drawn from, so seeding the rng after the bank is loaded still takes effect.
+        # Each deck only stores the positions that have been swapped: position -> question index.
+        self.decks = [{} for _ in self.tiers]
+        self.drawn = set()
+        self.drawn_counts = [0] * len(self.tiers)
+        self.tier = 0
+
+    # Function to load a bank from question files
+    @classmethod
+    def from_files(cls, paths, rng=random):
+        return cls([parse_file(path, tier) for tier, path in enumerate(paths)], rng)
+
+    # Function to load a bank from a compiled bank file
+    @classmethod
+    def from_compiled(cls, path, rng=random):
+        return cls(CompiledBank(path).tiers, rng)
+
+    # Function to load the questions in the quickest way available
+    @classmethod
+    def load(cls, paths, index=None, rng=random):
+        """Loads question files through the index and their compiled banks, updating them first where needed.
+
+        Args:
+            paths (list): The question files, easiest tier first
+            index (str): The index file, or None to always parse the files
+            rng (random.Random): Source of randomness for shuffling the decks
+
+        Returns:
+            QuestionBank: The loaded bank, with the problems the index holds for its files
+        """
+        if index is None:
+            return cls.from_files(paths, rng)
+        try:
+            directory = os.path.dirname(index)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            entries = update_index(paths, index)
+            tiers = [
+                CompiledBank(segment_path(index, entry["sha1"]), tier).tiers[0] for tier, entry in enumerate(entries)
+            ]
+        except (OSError, ValueError, KeyError, struct.error):
+            # A read-only or full disk only costs us the compiled copies, not the questions.
+            return cls.from_files(paths, rng)
+        bank = cls(tiers, rng)
+        bank.problems = [
+            Problem(path, *problem) for path, entry in zip(paths, entries) for problem in entry["problems"]
+        ]
+        return bank
+
+    # Helper function - draws a random undrawn question index from a tier's deck
+    def deal(self, tier):
+        # One step of a Fisher-Yates shuffle: pick any of the undrawn positions and move the last undrawn one into it
+        left = len(self.tiers[tier]) - self.drawn_counts[tier]
+        deck = self.decks[tier]
+        position = self.rng.randrange(left)
+        index = deck.get(position, position)
+        last = deck.pop(left - 1, left - 1)
+        if position != left - 1:
+            deck[position] = last
+        return index
+
+    # Function to draw the next question
+    def draw(self):
+        """Draws a random question that hasn't been drawn yet from the easiest tier that has any left.
+
+        Returns:
+            Question: The question, or None once every question has been drawn
+        """
+        while self.tier < len(self.tiers):
+            if self.remaining(self.tier):
+                index = self.deal(self.tier)
+                self.drawn.add((self.tier, index))
+                self.drawn_counts[self.tier] += 1
+                return self.tiers[self.tier][index]
+            self.tier += 1
+        return None
+
+    # Function to check whether a question has been drawn
+    def is_drawn(self, tier, index):
+        return (tier, index) in self.drawn
+
+    # Function to get the number of questions that haven't been drawn yet
+    def remaining(self, tier=None):
+        if tier is None:
+            return self.total - len(self.drawn)
+        return len(self.tiers[tier]) - self.drawn_counts[tier]
+
+    # Function to put every question back
+    def reset(self):
+        self.decks = [{} for _ in self.tiers]
+        self.drawn = set()
+        self.drawn_counts = [0] * len(self.tiers)
+        self.tier = 0
+
+
+# Class to sample indices in proportion to integer weights that change over time
+class FenwickTree:
+    # Initialization function
+    def __init__(self, weights):
+        """Builds the tree in O(n).
+
+        Args:
+            weights (list): The starting weight of every index - non-negative integers, so sums never drift
+        """
+        self.weights = list(weights)
+        self.tree = [0] + self.weights
+        # Push every node's sum up to its parent instead of adding the weights one at a time
+        for i in range(1, len(self.tree)):
+            parent = i + (i & -i)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.weights)
+        # Highest power of two that fits, where the search for an index starts
+        self.top = 1 << (len(self.weights).bit_length() - 1) if self.weights else 0
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __getitem__(self, index):
+        return self.weights[index]
+
+    # Function to change the weight of an index in O(log n)
+    def update(self, index, weight):
+        delta = weight - self.weights[index]
+        if not delta:
+            return
+        self.weights[index] = weight
+        self.total += delta
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    # Function to find the index a point in the running total of the weights falls in, in O(log n)
+    def find(self, target):
+        """Finds the index whose weight covers target, i.e. the one where target falls between the sum of the weights
+        before it and that sum plus its own weight. Drawing target uniformly from [0, total) picks every index with
+        probability proportional to its weight.
+
+        Args:
+            target (float): A point from 0 up to (not including) total
+
+        Returns:
+            int: The index
+        """
+        position = 0
+        step = self.top
+        while step:
+            nxt = position + step
+            if nxt < len(self.tree) and self.tree[nxt] <= target:
+                position = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return position
+
+
+# Class to pick questions based on the player's progress and mistakes
+class QuestionScheduler:
+    # Initialization function
+    def __init__(
+        self,
+        tiers,
+        rng=random,
+        tier_falloff=0.25,
+        wrong_boost=2,
+        max_boosts=3,
+        cooldown=5,
+        recency=(0, 1, 2, 4),
+    ):
+        """Creates a scheduler that draws questions at random, weighted by how useful asking them is right now.
+
+        Every question has an integer weight: its recency weight, doubled (by default) for every time the player got
+        it wrong. A question that was just asked sits out for cooldown draws, then climbs back through the recency
+        weights, cooldown draws per step, to the weight of a question that was never asked. A question answered
+        correctly is retired. Every tier keeps its weights in a Fenwick tree, and the tier to draw from is picked
+        first, with the tier the player is on (focus) weighted highest and every tier away from it tier_falloff times
+        lower. Drawing and reweighting are O(tiers + log n).
+
+        Args:
+            tiers (list): A sequence of questions for every difficulty tier, easiest first
+            rng (random.Random): Source of randomness - the random module by default, so random.seed() applies
+            tier_falloff (float): How much less likely every tier away from the focus tier is
+            wrong_boost (int): Weight multiplier for every wrong answer
+            max_boosts (int): Most wrong answers that count towards the multiplier
+            cooldown (int): Number of draws each recency step lasts
+            recency (tuple): Weights of an asked question as time passes - the last one is also for new questions
+        """
+        self.tiers = list(tiers)
+        self.rng = rng
+        self.tier_falloff = tier_falloff
+        self.wrong_boost = wrong_boost
+        self.max_boosts = max_boosts
+        self.cooldown = cooldown
+        self.recency = tuple(recency)
+        self.focus = 0
+        self.reset()
+
+    # Function to forget every answer and start again
+    def reset(self):
+        self.trees = [FenwickTree([self.recency[-1]] * len(questions)) for questions in self.tiers]
+        # Only questions that have been asked get an entry: (tier, index) -> wrong answers / draw it was last asked in
+        self.wrongs = {}
+        self.asked = {}
+        self.retired = set()
+        # Heap of upcoming recency steps as (draw, tier, index, draw it was asked in). Every draw adds a step per
+        # recency stage, cooldown draws apart, so the steps of later draws interleave with earlier ones and only a
+        # heap keeps the next due step first.
+        self.steps = []
+        self.draws = 0
+
+    # Helper function - the weight a question should have now
+    def weight(self, key):
+        if key in self.retired:
+            return 0
+        stage = len(self.recency) - 1
+        asked = self.asked.get(key)
+        if asked is not None:
+            stage = min((self.draws - asked) // self.cooldown, stage)
+        return self.recency[stage] * self.wrong_boost ** min(self.wrongs.get(key, 0), self.max_boosts)
+
+    # Helper function - applies the recency steps that are due, or the next ones if nothing can be drawn
+    def advance(self):
+        while self.steps and (self.steps[0][0] <= self.draws or not any(tree.total for tree in self.trees)):
+            due, tier, index, asked = heapq.heappop(self.steps)
+            # Steps of a question asked again since are out of date
+            if self.asked.get((tier, index)) != asked:
+                continue
+            # Skip ahead if every question left is cooling down
+            self.draws = max(self.draws, due)
+            self.trees[tier].update(index, self.weight((tier, index)))
+
+    # Function to get how likely a tier is to be drawn from, relative to the focus tier
+    def tier_weight(self, tier):
+        return self.tier_falloff ** abs(tier - self.focus)
+
+    # Function to draw the next question
+    def draw(self):
+        """Draws a question that hasn't been answered correctly yet.
+
+        Returns:
+            Question: The question, or None once every question has been answered correctly
+        """
+        self.advance()
+        totals = [tree.total * self.tier_weight(tier) for tier, tree in enumerate(self.trees)]
+        if not any(totals):
+            return None
+        target = self.rng.random() * sum(totals)
+        # Pick the tier first - if rounding carries target past the end, the last tier with questions left is used
+        for candidate, total in enumerate(totals):
+            if total:
+                tier = candidate
+                if target < total:
+                    break
+                target -= total
+        tree = self.trees[tier]
+        index = tree.find(min(target / self.tier_weight(tier), tree.total - 1))
+
+        key = (tier, index)
+        self.asked[key] = self.draws
+        tree.update(index, self.weight(key))
+        for step in range(1, len(self.recency)):
+            heapq.heappush(self.steps, (self.draws + step * self.cooldown, tier, index, self.draws))
+        self.draws += 1
+        return self.tiers[tier][index]
+
+    # Function to record the player's answer to a question
+    def answered(self, question, correct):
+        key = (question.tier, question.index)
+        if correct:
+            self.retired.add(key)
+        else:
+            self.wrongs[key] = self.wrongs.get(key, 0) + 1
+        self.trees[question.tier].update(question.index, self.weight(key))
+
+    # Function to get the number of questions that haven't been answered correctly yet
+    def remaining(self):
+        return sum(len(questions) for questions in self.tiers) - len(self.retired)
+
+
+# Function to run the question bank tools from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MindMaze question bank tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compileParser = commands.add_parser("compile", help="compile question files into a memory-mappable bank")
+    compileParser.add_argument("files", nargs="+", help="question files, easiest tier first")
+    compileParser.add_argument("-o", "--output", default="questions.mmq", help="compiled bank to write")
+    lintParser = commands.add_parser("lint", help="check question files and report problems with line numbers")
+    lintParser.add_argument("files", nargs="*", default=DEFAULT_FILES, help="question files to check")
+    lintParser.add_argument("--index", help="also bring this index up to date, checking only files that changed")
+    lintParser.add_argument("--strict", action="store_true", help="fail on warnings as well as errors")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        count = compile_bank(args.files, args.output)
+        print(f"Compiled {count} questions from {len(args.files)} files into {args.output}")
+        return 0
+
+    if args.index:
+        directory = os.path.dirname(args.index)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        entries = update_index(args.files, args.index)
+        problems = [
+            Problem(path, *problem) for path, entry in zip(args.files, entries) for problem in entry["problems"]
+        ]
+    else:
+        problems = [problem for path in args.files for problem in lint_file(path)]
+    for problem in problems:
+        print(problem)
+    errors = sum(1 for problem in problems if problem.severity == "error")
+    print(f"{len(args.files)} files checked: {errors} errors, {len(problems) - errors} warnings")
+    return 1 if errors or (args.strict and problems) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import math
+
+import numpy as np
+
+"""
+First-person raycaster.
+
+Every screen column casts one ray across the maze grid with a DDA (digital differential analyzer) grid traversal, and
+all columns are stepped together as NumPy arrays, so a frame costs one small array operation per grid step instead of
+one Python loop per column. The result is a pixel array laid out like pygame.surfarray (indexed [x, y]) with every
+pixel packed into a uint32 as 0xRRGGBB, ready to be pushed with surfarray.blit_array() onto a 32-bit surface with
+the masks in PIXEL_MASKS. Packed pixels are about three times quicker to fill and blit than separate RGB channels.
+
+Positions and headings use the same (first, second) grid axes as maze.HEADINGS.
+"""
+
+# Masks of a pygame surface whose pixels match the packed 0xRRGGBB values the raycaster produces
+PIXEL_MASKS = (0xFF0000, 0x00FF00, 0x0000FF, 0)
+
+
+# Helper function - packs RGB colours into 0xRRGGBB values
+def pack(colours):
+    colours = np.asarray(colours).astype(np.uint32)
+    return (colours[..., 0] << 16) | (colours[..., 1] << 8) | colours[..., 2]
+
+
+# Class to render the first-person view by raycasting
+class Raycaster:
+    # Initialization function
+    def __init__(
+        self,
+        width,
+        height,
+        max_distance=16,
+        fov=66,
+        wall=(170, 170, 190),
+        ceiling=(60, 60, 70),
+        floor=(110, 100, 90),
+    ):
+        """Creates a raycaster for a view of the given size.
+
+        Args:
+            width (int): Width of the view in pixels, one ray per column
+            height (int): Height of the view in pixels
+            max_distance (float): Furthest distance in cells the player can see - walls fade out towards it
+            fov (float): Horizontal field of view in degrees
+            wall (tuple): RGB colour of a fully lit wall
+            ceiling (tuple): RGB colour of the ceiling at the top of the view
+            floor (tuple): RGB colour of the floor at the bottom of the view
+        """
+        self.width = width
+        self.height = height
+        self.max_distance = max_distance
+        # Every grid step crosses one cell boundary, and a ray can cross about two per cell of distance
+        self.max_steps = int(math.ceil(max_distance)) * 2 + 2
+        self.plane = math.tan(math.radians(fov) / 2)
+        # Position of every column across the camera plane, from -1 (left edge) to 1 (right edge)
+        self.camera = (2 * (np.arange(width) + 0.5) / width - 1).astype(np.float64)
+        self.columns = np.arange(width)
+        self.wall = np.array(wall, dtype=np.float64)
+        rows = np.arange(height)
+        # Distance of the middle of every row from the horizon - walls are centred on it
+        self.fromHorizon = np.abs(rows + 0.5 - height / 2)
+
+        # Ceiling and floor fade into darkness at the horizon
+        fade = self.fromHorizon / (height / 2)
+        background = np.where(
+            (rows < height / 2)[:, None], np.array(ceiling, dtype=np.float64), np.array(floor, dtype=np.float64)
+        ) * fade[:, None]
+        self.background = pack(background)
+
+    # Function to cast one ray per column
+    def cast(self, grid, position, heading):
+        """Casts a ray for every column of the view.
+
+        Args:
+            grid (numpy.ndarray): Maze grid where 1 is wall and 0 is path - anything outside it counts as wall
+            position (tuple): The player's position along the grid's (first, second) axes
+            heading (tuple): Step along the grid's (first, second) axes the player is facing
+
+        Returns:
+            tuple: Arrays with the perpendicular distance to the wall hit by every column (inf if none is in range),
+            the axis (0 or 1) of the grid line it hit and how far along the wall face it hit (0 to 1).
+        """
+        grid = np.asarray(grid)
+        gridHeight, gridWidth = grid.shape
+        origin = np.array(position, dtype=np.float64)
+        forward = np.array(heading, dtype=np.float64)
+        # The camera plane points to the player's right, the opposite of maze.view_offsets()' left
+        right = np.array((-heading[1], heading[0]), dtype=np.float64) * self.plane
+        rays = forward[None, :] + self.camera[:, None] * right[None, :]
+
+        with np.errstate(divide="ignore"):
+            delta = np.abs(1.0 / rays)
+        cell = np.broadcast_to(np.floor(origin).astype(np.int64), rays.shape).copy()
+        step = np.where(rays < 0, -1, 1)
+        # Distance along every ray to the first grid line it crosses on each axis
+        sideDistance = np.where(rays < 0, origin - cell, cell + 1 - origin) * delta
+        sideDistance[np.isinf(delta)] = np.inf
+
+        distance = np.full(self.width, np.inf)
+        axis = np.zeros(self.width, dtype=np.intp)
+        active = np.ones(self.width, dtype=bool)
+        for _ in range(self.max_steps):
+            # Step every ray that is still going across whichever grid line it reaches first
+            index = self.columns[active]
+            stepAxis = (sideDistance[index, 1] < sideDistance[index, 0]).astype(np.intp)
+            travelled = sideDistance[index, stepAxis]
+            inRange = travelled <= self.max_distance
+            active[index[~inRange]] = False
+            index, stepAxis, travelled = index[inRange], stepAxis[inRange], travelled[inRange]
+            if not len(index):
+                break
+            cell[index, stepAxis] += step[index, stepAxis]
+            sideDistance[index, stepAxis] += delta[index, stepAxis]
+
+            first, second = cell[index, 0], cell[index, 1]
+            inside = (first >= 0) & (first < gridHeight) & (second >= 0) & (second < gridWidth)
+            hit = ~inside | (
+                grid[np.clip(first, 0, gridHeight - 1), np.clip(second, 0, gridWidth - 1)] != 0
+            )
+            hitIndex = index[hit]
+            distance[hitIndex] = travelled[hit]
+            axis[hitIndex] = stepAxis[hit]
+            active[hitIndex] = False
+
+        # Where along the wall face each ray hit, measured on the axis it didn't cross
+        along = origin[1 - axis] + np.where(np.isinf(distance), 0, distance) * rays[self.columns, 1 - axis]
+        return distance, axis, along - np.floor(along)
+
+    # Function to render the view into a pixel array
+    def render(self, grid, position, heading):
+        """Renders the view from a position.
+
+        Args:
+            grid (numpy.ndarray): Maze grid where 1 is wall and 0 is path
+            position (tuple): The player's position along the grid's (first, second) axes
+            heading (tuple): Step along the grid's (first, second) axes the player is facing
+
+        Returns:
+            numpy.ndarray: The (width, height) uint32 array of packed 0xRRGGBB pixels
+        """
+        distance, axis, along = self.cast(grid, position, heading)
+
+        # Closer walls are taller and brighter, walls along the second axis are a little darker and the edges of every
+        # wall block are darkened so the individual cells can be told apart
+        with np.errstate(divide="ignore"):
+            halfHeight = self.height / distance / 2
+        shade = np.clip(1 - distance / self.max_distance, 0, 1)
+        shade *= np.where(axis == 1, 0.75, 1.0)
+        shade *= np.where((along < 0.03) | (along > 0.97), 0.6, 1.0)
+        colour = pack(self.wall[None, :] * shade[:, None])
+
+        slices = self.fromHorizon[None, :] < halfHeight[:, None]
+        return np.where(slices, colour[:, None], self.background[None, :])
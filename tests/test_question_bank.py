@@ -0,0 +1,26 @@
+################
+#   MindMaze   #
+# Nyala Group  #
+################
+
+# Imports
+import random
+
+from mindmaze.question_bank import Question, QuestionScheduler
+
+
+# Helper function - a tier of n made-up questions
+def make_tier(tier, n):
+    return [Question(tier, index, f"q. Question {index}?", "a", ("b", "c", "d")) for index in range(n)]
+
+
+# The weights kept in the Fenwick trees must match what weight() says they should be after every draw
+def test_scheduler_tree_weights_follow_weight():
+    scheduler = QuestionScheduler([make_tier(0, 30)], rng=random.Random(1))
+    for _ in range(200):
+        question = scheduler.draw()
+        scheduler.answered(question, False)
+        # Apply the recency steps that came due with this draw before comparing
+        scheduler.advance()
+        for index in range(30):
+            assert scheduler.trees[0][index] == scheduler.weight((0, index))